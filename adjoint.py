@@ -0,0 +1,185 @@
+import csv
+import numpy as np
+import os
+from profiling import solve_ivp, stage, timed
+from scipy.sparse import bmat, csr_matrix
+
+# Cost of a FrozenModel against the experimental time courses and its gradient with respect to all parameters, by
+# the adjoint method. With data at times t_i the adjoint state is integrated backwards,
+#
+#   dlambda/dt = -J(y)^T . lambda,   lambda(t_i-) = lambda(t_i+) + dC/dy(t_i)
+#
+# and the gradient is dC/dp = lambda(0)^T . dy0/dp + int lambda^T . df/dp dt, where the integral is accumulated as
+# a quadrature alongside lambda. The cost of one gradient is a forward and a backward solve, independent of the
+# number of parameters. The injection at the end of the equilibration sets the perturbed species to fixed amounts,
+# so the corresponding components of lambda are zero before it (i.e., during the equilibration phase).
+
+DEFAULT_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'DATA', 'Tasseff_2010.csv')
+
+
+def load_data(filename=DEFAULT_DATA):
+    """
+    Read the experimental time courses. Returns {observable: (times, average, stderr)}, times in seconds after the
+    stimulus.
+    """
+    data = {}
+    with open(filename, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            data.setdefault(row['observable'], []).append(
+                (float(row['time']), float(row['average']), float(row['stderr'])))
+    return dict((obs, tuple(np.array(col) for col in zip(*rows))) for obs, rows in data.items())
+
+
+class DataFitObjective(object):
+    """
+    Weighted squared error sum(((x - average) / stderr)^2) of the scaled observables x(t) = obs(t) / obs(0) (fold
+    change with respect to the start of the stimulus, as in the data) for the protocol: equilibrate for t_equil
+    (must be finite), then set the species in 'perturb' (the DHT injection) and simulate up to the last data time.
+    """
+    def __init__(self, frozen, data=None, t_equil=3600, perturb=None, rtol=1e-6, atol=1e-12, adjoint_atol=1e-8,
+                 method='BDF'):
+        self.frozen = frozen
+        self.data = load_data() if data is None else data
+        if t_equil is not None and np.isinf(t_equil):
+            raise Exception('The adjoint gradient requires a finite equilibration time')
+        self.t_equil = t_equil
+        self.perturb = {'DHT(b=None)': 10} if perturb is None else perturb
+        self.rtol = rtol
+        self.atol = atol
+        self.adjoint_atol = adjoint_atol
+        self.method = method
+
+        # output times (including 0 for the scaling) and the (time, observable) index of every data point
+        self.times = np.unique(np.concatenate([[0.]] + [times for times, _, _ in self.data.values()]))
+        time_idx, obs_idx, average, stderr = [], [], [], []
+        for obs_name, (times, avg, err) in self.data.items():
+            time_idx.append(np.searchsorted(self.times, times))
+            obs_idx.append(np.full(len(times), self.frozen.obs_names.index(obs_name)))
+            average.append(avg)
+            stderr.append(err)
+        self._time_idx, self._obs_idx = np.concatenate(time_idx), np.concatenate(obs_idx)
+        self._average, self._stderr = np.concatenate(average), np.concatenate(stderr)
+        self._perturbed = [species if isinstance(species, (int, np.integer)) else frozen.species_index(species)
+                           for species in self.perturb]
+
+        # reaction -> rate parameter map, for df/dp
+        self._rate_params = csr_matrix((np.ones(frozen.n_reactions), (np.arange(frozen.n_reactions),
+                                                                       frozen.rate_param_idx)),
+                                       shape=(frozen.n_reactions, len(frozen.param_names)))
+        self._stoich_t = frozen.stoich.T.tocsr()
+
+    def _solve(self, fun, t_span, y0, args, atol, t_eval=None, dense_output=False, jac=None):
+        sol = solve_ivp(fun, t_span, y0, method=self.method, t_eval=t_eval, args=args, rtol=self.rtol, atol=atol,
+                        dense_output=dense_output, jac=jac)
+        if not sol.success:
+            raise Exception('Integration failed: %s' % sol.message)
+        return sol
+
+    @timed('forward')
+    def _forward(self, param_values, dense_output):
+        frozen = self.frozen
+        k = frozen.rate_constants(param_values)
+        y0 = frozen.initial_state(param_values)
+        equil = None
+        if self.t_equil is not None:
+            equil = self._solve(frozen.rhs, (0, self.t_equil), y0, (k,), self.atol, dense_output=dense_output,
+                                jac=frozen.jacobian)
+            y0 = equil.y[:, -1]
+        y0 = frozen.perturb(y0, self.perturb)
+        stim = self._solve(frozen.rhs, (0, self.times[-1]), y0, (k,), self.atol, t_eval=self.times,
+                           dense_output=dense_output, jac=frozen.jacobian)
+        return k, equil, stim
+
+    def _residuals(self, obs):
+        # obs: (n_times, n_obs) at self.times; returns residuals and scaled observables of the data points
+        ref = obs[0, self._obs_idx]
+        scaled = obs[self._time_idx, self._obs_idx] / ref
+        return (scaled - self._average) / self._stderr, scaled, ref
+
+    def cost(self, param_values=None):
+        param_values = self.frozen.get_param_values(param_values)
+        k, equil, stim = self._forward(param_values, False)
+        res = self._residuals(self.frozen.observables(stim.y.T))[0]
+        return np.sum(res ** 2)
+
+    def _adjoint_rhs(self, t, z, y_sol, k):
+        frozen = self.frozen
+        y = y_sol(t)
+        lam = z[:frozen.n_species]
+        # lambda^T . df/dp: propensities without the rate parameter (dv_j/dp_j), summed per rate parameter
+        dv = frozen.engine.propensities(y, frozen.rate_factor)
+        dq = np.bincount(frozen.rate_param_idx, weights=self._stoich_t.dot(lam) * dv,
+                         minlength=len(frozen.param_names))
+        return -np.concatenate([frozen.jacobian(t, y, k).T.dot(lam), dq])
+
+    def _adjoint_jacobian(self, t, z, y_sol, k):
+        frozen = self.frozen
+        y = y_sol(t)
+        dv = frozen.engine.propensities(y, frozen.rate_factor)
+        dfdp = csr_matrix(frozen.stoich.multiply(dv)).dot(self._rate_params)
+        n_params = len(frozen.param_names)
+        return -bmat([[frozen.jacobian(t, y, k).T, None],
+                      [dfdp.T, csr_matrix((n_params, n_params))]], format='csr')
+
+    def _adjoint_atol(self):
+        # the quadrature is left out of the error control (as in CVODES by default)
+        return np.concatenate([np.full(self.frozen.n_species, self.adjoint_atol),
+                               np.full(len(self.frozen.param_names), np.inf)])
+
+    def cost_and_gradient(self, param_values=None):
+        """
+        Cost and its gradient with respect to all model parameters (in model.parameters order).
+        """
+        frozen = self.frozen
+        param_values = frozen.get_param_values(param_values)
+        k, equil, stim = self._forward(param_values, True)
+        obs = frozen.observables(stim.y.T)
+        res, scaled, ref = self._residuals(obs)
+
+        # dC/dobs at each output time; obs(0) enters through the scaling
+        dc_dobs = np.zeros_like(obs)
+        weights = 2 * res / self._stderr / ref
+        np.add.at(dc_dobs, (self._time_idx, self._obs_idx), weights)
+        np.add.at(dc_dobs, (np.zeros_like(self._obs_idx), self._obs_idx), -weights * scaled)
+
+        # backwards over the stimulus phase, jumping at the output times
+        atol = self._adjoint_atol()
+        z = np.zeros(frozen.n_species + len(frozen.param_names))
+        with stage('adjoint'):
+            for i in range(len(self.times) - 1, -1, -1):
+                z[:frozen.n_species] += frozen.obs_matrix.T.dot(dc_dobs[i])
+                if i > 0:
+                    z = self._solve(self._adjoint_rhs, (self.times[i], self.times[i - 1]), z, (stim.sol, k), atol,
+                                    jac=self._adjoint_jacobian).y[:, -1]
+
+            # the injection: perturbed species don't depend on the state before it
+            z[self._perturbed] = 0.
+            if equil is not None:
+                z = self._solve(self._adjoint_rhs, (self.t_equil, 0), z, (equil.sol, k), atol,
+                                jac=self._adjoint_jacobian).y[:, -1]
+
+        lam, grad = z[:frozen.n_species], z[frozen.n_species:].copy()
+        np.add.at(grad, frozen.init_param_idx, lam[frozen.init_species_idx])
+        return np.sum(res ** 2), grad
+
+
+if __name__ == '__main__':
+    import time
+    from frozen_model import FrozenModel
+
+    frozen = FrozenModel()
+    objective = DataFitObjective(frozen)
+
+    start = time.time()
+    cost, grad = objective.cost_and_gradient()
+    print('Cost %g, gradient with respect to %d parameters in %g s' % (cost, len(grad), time.time() - start))
+
+    # compare with central finite differences for the largest (relative) gradient components
+    for i in np.argsort(-np.abs(grad * frozen.param_values))[:5]:
+        costs = []
+        for factor in [1.001, 0.999]:
+            p = frozen.param_values.copy()
+            p[i] *= factor
+            costs.append(objective.cost(p))
+        fd = (costs[0] - costs[1]) / (0.002 * frozen.param_values[i])
+        print('dC / d %s: adjoint %g, finite differences %g' % (frozen.param_names[i], grad[i], fd))
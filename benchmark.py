@@ -0,0 +1,188 @@
+import argparse
+import json
+import numpy as np
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Benchmarks of model construction, network generation and simulation. Every stage is timed separately and the
+# results are written as JSON, e.g.
+#
+#   python benchmark.py -o bench_<commit>.json
+#   python benchmark.py --stages simulate ensemble --compare bench_<other commit>.json
+#
+# --compare reports the ratio of the median times and flags stages that got slower by more than --threshold.
+
+DHT_PERTURB = {'DHT(b=None)': 10}
+T_EQUIL = 3600
+TSPAN = np.linspace(0, 49 * 3600, 60 * 49 + 1)
+STAGES = ['build', 'divide_multipliers', 'network', 'simulate', 'ensemble']
+
+
+def _timeit(fn, repeat=1, setup=None):
+    times = []
+    for i in range(repeat):
+        args = setup() if setup is not None else ()
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def bench_build(repeat):
+    # import in a fresh interpreter (the module is cached after the first import in this one)
+    import_times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', 'import AR_model'],
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+        import_times.append(time.perf_counter() - start)
+    from AR_model import build_model
+    return {'import_AR_model': import_times,
+            'build_model': _timeit(lambda: build_model(divide_multipliers=False, generate_network=False), repeat)}
+
+
+def bench_divide_multipliers(repeat):
+    from AR_model import build_model
+    from util import divide_out_bng_multipliers
+    # deriving the factors from the (cached) network and dividing them out
+    return {'divide_out_bng_multipliers': _timeit(
+        lambda model: divide_out_bng_multipliers(model, verbose=False), repeat,
+        setup=lambda: (build_model(divide_multipliers=False),))}
+
+
+def bench_network(repeat):
+    from AR_model import build_model
+    from network_cache import generate_equations_cached
+    cache_dir = tempfile.mkdtemp()
+    try:
+        def setup():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            return build_model(divide_multipliers=False, generate_network=False),
+        generate = _timeit(lambda model: generate_equations_cached(model, cache_dir=cache_dir), repeat, setup)
+        cached = _timeit(lambda model: generate_equations_cached(model, cache_dir=cache_dir), repeat,
+                         setup=lambda: (build_model(divide_multipliers=False, generate_network=False),))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return {'bng_generate_network': generate, 'load_cached_network': cached}
+
+
+def _run_dht_protocol(solver, model):
+    # equilibrate, inject DHT, simulate (the DHT protocol of AR_model.py's __main__)
+    y0 = solver.run(tspan=[0, T_EQUIL]).species[-1]
+    for species, value in DHT_PERTURB.items():
+        y0[[str(sp) for sp in model.species].index(species)] = value
+    return solver.run(tspan=TSPAN, initials=y0)
+
+
+def bench_simulate(repeat):
+    from pysb.simulator import ScipyOdeSimulator
+    from AR_model import get_model
+    from frozen_model import FrozenModel
+    model = get_model()
+    solvers = []
+
+    def first_run():
+        # including the simulator setup and code generation
+        solver = ScipyOdeSimulator(model, cleanup=True)
+        _run_dht_protocol(solver, model)
+        solvers.append(solver)
+    first = _timeit(first_run, 1)
+    repeated = _timeit(lambda: _run_dht_protocol(solvers[0], model), repeat)
+    frozen = FrozenModel()
+    frozen_times = _timeit(lambda: frozen.simulate(TSPAN, t_equil=T_EQUIL, perturb=DHT_PERTURB), repeat)
+    return {'scipy_ode_simulator_first_run': first, 'scipy_ode_simulator_repeated_run': repeated,
+            'frozen_model_simulate': frozen_times}
+
+
+def bench_ensemble(repeat, n_members=16, workers=(1, 4, 16)):
+    from ensemble import run_ensemble_parallel, sample_parameter_sets
+    from frozen_model import FrozenModel, DEFAULT_ARTIFACT
+    frozen = FrozenModel()
+    param_sets = sample_parameter_sets(frozen.param_values, frozen.param_cv, n_members, seed=0)
+    results = {}
+    for n_workers in workers:
+        times = _timeit(lambda: run_ensemble_parallel(DEFAULT_ARTIFACT, TSPAN, param_sets, n_workers=n_workers,
+                                                      chunk_size=1, t_equil=T_EQUIL, perturb=DHT_PERTURB), repeat)
+        results['ensemble_%d_workers' % n_workers] = times
+        # members per hour
+        results['ensemble_%d_workers_throughput' % n_workers] = [n_members / t * 3600 for t in times]
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def run_benchmarks(stages=None, repeat=3, n_members=16, workers=(1, 4, 16), verbose=True):
+    """
+    Run the benchmark stages (default: all of STAGES). Returns a JSON-serializable dict with the timings (in s) of
+    every benchmark and summary statistics.
+    """
+    benchmarks = {
+        'build': lambda: bench_build(repeat),
+        'divide_multipliers': lambda: bench_divide_multipliers(repeat),
+        'network': lambda: bench_network(repeat),
+        'simulate': lambda: bench_simulate(repeat),
+        'ensemble': lambda: bench_ensemble(repeat, n_members, workers),
+    }
+    results = {}
+    for stage in stages or STAGES:
+        if verbose:
+            print('Running %s benchmarks...' % stage)
+        for name, times in benchmarks[stage]().items():
+            results[name] = {'stage': stage, 'times': times, 'min': min(times), 'median': float(np.median(times))}
+            if verbose:
+                print('  %s: %g (median of %d)' % (name, results[name]['median'], len(times)))
+    return {'commit': _git_commit(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(), 'platform': platform.platform(), 'cpu_count': os.cpu_count(),
+            'benchmarks': results}
+
+
+def compare(results, baseline, threshold=1.2):
+    """
+    Ratios of the median times in results vs. baseline. Returns {name: ratio} of the benchmarks that are slower by
+    more than the threshold (throughputs are inverted, i.e. a lower throughput counts as slower).
+    """
+    slower = {}
+    for name, bench in results['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        ratio = bench['median'] / baseline['benchmarks'][name]['median']
+        if name.endswith('_throughput'):
+            ratio = 1. / ratio
+        print('%s: %.3gx %s' % (name, ratio, '(SLOWER)' if ratio > threshold else ''))
+        if ratio > threshold:
+            slower[name] = ratio
+    return slower
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks of the AR model pipeline')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--n-members', type=int, default=16, help='ensemble size for the ensemble benchmarks')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('-o', '--output', help='JSON file for the results (default: print)')
+    parser.add_argument('--compare', help='JSON file of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.2, help='slowdown ratio flagged by --compare')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.stages, args.repeat, args.n_members, args.workers)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+    else:
+        print(json.dumps(results, indent=1))
+    if args.compare:
+        with open(args.compare) as f:
+            slower = compare(results, json.load(f), args.threshold)
+        sys.exit(1 if slower else 0)
@@ -0,0 +1,145 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import os
+from scipy.optimize import differential_evolution, minimize
+from adjoint import DataFitObjective
+
+# Calibration of a FrozenModel against the experimental data (see adjoint.DataFitObjective). Parameters are
+# optimized as log10 values within bounds derived from the Table S1 uncertainties. Optimizers are plain functions
+# optimizer(problem, x0, map_fn, **kwargs) -> scipy OptimizeResult, registered in OPTIMIZERS; population-based
+# optimizers evaluate their candidates with map_fn, which spreads them over a process pool.
+
+
+class CalibrationProblem(object):
+    """
+    Log10-space parameter vector x for the parameters in 'params' (names or indices; default: all rate constants).
+    Bounds are log10(value) +- n_sigma standard deviations of the log-normal with the Table S1 cv, or
+    +- default_decades for parameters without an uncertainty. objective_kwargs are passed to DataFitObjective
+    (data, t_equil, perturb, tolerances).
+    """
+    def __init__(self, frozen, params=None, n_sigma=2, default_decades=1, **objective_kwargs):
+        self.frozen = frozen
+        if params is None:
+            params = np.unique(frozen.rate_param_idx)
+        self.param_idx = np.array([frozen.param_names.index(p) if isinstance(p, str) else p for p in params],
+                                  dtype=np.int64)
+        self.param_names = [frozen.param_names[i] for i in self.param_idx]
+        self.objective = DataFitObjective(frozen, **objective_kwargs)
+        # to rebuild the same problem in pool workers
+        self.config = dict(params=self.param_names, n_sigma=n_sigma, default_decades=default_decades,
+                           **objective_kwargs)
+
+        self.x0 = np.log10(frozen.param_values[self.param_idx])
+        cv = frozen.param_cv[self.param_idx]
+        half_width = np.where(np.isnan(cv) | (cv <= 0), default_decades,
+                              n_sigma * np.sqrt(np.log(1 + np.nan_to_num(cv) ** 2)) / np.log(10))
+        self.bounds = np.column_stack([self.x0 - half_width, self.x0 + half_width])
+
+    def to_param_values(self, x):
+        param_values = self.frozen.param_values.copy()
+        param_values[self.param_idx] = 10. ** np.asarray(x)
+        return param_values
+
+    def cost(self, x):
+        # failed integrations (e.g., for extreme candidates) count as infinitely bad
+        try:
+            return self.objective.cost(self.to_param_values(x))
+        except Exception:
+            return np.inf
+
+    def cost_and_gradient(self, x):
+        # failures are handled as in cost(), with a zero gradient (the line search then backtracks)
+        param_values = self.to_param_values(x)
+        try:
+            cost, grad = self.objective.cost_and_gradient(param_values)
+        except Exception:
+            return np.inf, np.zeros(len(self.param_idx))
+        # dC/dlog10(p) = dC/dp * p * ln(10)
+        return cost, grad[self.param_idx] * param_values[self.param_idx] * np.log(10)
+
+
+def optimize_lbfgs(problem, x0, map_fn, maxiter=100, verbose=False, **kwargs):
+    # gradient-based, using the adjoint gradient; map_fn is not used
+    return minimize(problem.cost_and_gradient, x0, jac=True, method='L-BFGS-B', bounds=problem.bounds,
+                    options=dict(maxiter=maxiter, disp=verbose), **kwargs)
+
+
+def optimize_differential_evolution(problem, x0, map_fn, maxiter=100, popsize=15, seed=None, verbose=False,
+                                    **kwargs):
+    # the population of each generation is evaluated with map_fn (updating='deferred' is required for that)
+    return differential_evolution(problem.cost, problem.bounds, x0=x0, maxiter=maxiter, popsize=popsize, seed=seed,
+                                  workers=map_fn, updating='deferred', disp=verbose, polish=False, **kwargs)
+
+
+OPTIMIZERS = {
+    'lbfgs': optimize_lbfgs,
+    'differential_evolution': optimize_differential_evolution,
+}
+
+
+# per-process state of the pool workers (see _init_worker)
+_worker = {}
+
+
+def _init_worker(artifact, config):
+    from frozen_model import FrozenModel
+    _worker['problem'] = CalibrationProblem(FrozenModel(artifact), **config)
+
+
+def _worker_cost(x):
+    return _worker['problem'].cost(x)
+
+
+def calibrate(problem, optimizer='differential_evolution', x0=None, artifact=None, n_workers=None, **kwargs):
+    """
+    Minimize the data-fit cost over problem.bounds. optimizer is a name in OPTIMIZERS or a function with the same
+    signature. With n_workers > 1 candidates are evaluated in a process pool whose workers load the frozen network
+    from 'artifact' (default: frozen_model.DEFAULT_ARTIFACT); the pool is only started when the optimizer calls
+    map_fn (not for lbfgs). Returns (param_values, OptimizeResult).
+    """
+    from frozen_model import DEFAULT_ARTIFACT
+    if isinstance(optimizer, str):
+        optimizer = OPTIMIZERS[optimizer]
+    if x0 is None:
+        x0 = problem.x0
+    x0 = np.clip(x0, problem.bounds[:, 0], problem.bounds[:, 1])
+    if n_workers is None:
+        n_workers = os.cpu_count()
+
+    if n_workers <= 1:
+        result = optimizer(problem, x0, map, **kwargs)
+        return problem.to_param_values(result.x), result
+
+    executor = []
+
+    def map_fn(fn, xs):
+        # the optimizer's objective wrapper is replaced by the worker's own problem
+        if not executor:
+            executor.append(ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                                initargs=(artifact or DEFAULT_ARTIFACT, problem.config)))
+        return list(executor[0].map(_worker_cost, xs))
+
+    try:
+        result = optimizer(problem, x0, map_fn, **kwargs)
+    finally:
+        if executor:
+            executor[0].shutdown()
+    return problem.to_param_values(result.x), result
+
+
+if __name__ == '__main__':
+    import time
+    from frozen_model import FrozenModel
+
+    frozen = FrozenModel()
+    problem = CalibrationProblem(frozen)
+    print('Calibrating %d parameters, initial cost %g' % (len(problem.x0), problem.cost(problem.x0)))
+
+    start = time.time()
+    param_values, result = calibrate(problem, 'differential_evolution', maxiter=5, popsize=2, seed=0, verbose=True)
+    print('Differential evolution: cost %g after %d evaluations (%g s)' % (result.fun, result.nfev,
+                                                                           time.time() - start))
+
+    start = time.time()
+    param_values, result = calibrate(problem, 'lbfgs', x0=result.x, maxiter=20)
+    print('L-BFGS-B: cost %g after %d evaluations (%g s)' % (result.fun, result.nfev, time.time() - start))
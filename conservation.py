@@ -0,0 +1,74 @@
+import numpy as np
+from scipy.linalg import qr, solve
+from scipy.sparse import csr_matrix
+
+# Linear conservation laws of a mass-action network (e.g., total RNAp, eIF4E, each gene) and the reduced ODE system
+# without the dependent species. The laws span the left null space of the stoichiometry matrix, L . S = 0. They are
+# brought into the form M = [I | M_ind] (columns ordered dependent | independent, dependent species chosen by QR
+# with column pivoting), so that with totals T = M . y
+#
+#   y_dep = T - M_ind . y_ind,   dy_ind/dt = f_ind(y),   J_red = J_ind,ind - J_ind,dep . M_ind
+
+
+class ConservationLaws(object):
+    """
+    Conservation laws of a MassActionEngine, restricted to 'species' and 'reactions' (index arrays or masks) if
+    given; species outside the subset are left unchanged by expand().
+    """
+    def __init__(self, engine, species=None, reactions=None, tol=1e-10):
+        self.engine = engine
+        self.species = np.arange(engine.n_species) if species is None else np.arange(engine.n_species)[species]
+        q, laws = engine.stoich_basis(self.species, reactions, tol=tol)
+        self.n_conserved = len(laws)
+        if self.n_conserved > 0:
+            dependent = np.sort(qr(laws, pivoting=True, mode='economic')[2][:self.n_conserved])
+            laws = solve(laws[:, dependent], laws)
+            laws[np.abs(laws) < tol] = 0.
+        else:
+            dependent = np.array([], dtype=int)
+        independent = np.setdiff1d(np.arange(len(self.species)), dependent)
+        self.laws = csr_matrix(laws.reshape(self.n_conserved, len(self.species)))
+        self._m_ind = csr_matrix(laws[:, independent].reshape(self.n_conserved, len(independent)))
+        # indices into the full state vector
+        self.dependent = self.species[dependent]
+        self.independent = self.species[independent]
+
+    @property
+    def n_independent(self):
+        return len(self.independent)
+
+    def totals(self, y):
+        return self.laws.dot(np.asarray(y)[..., self.species].T).T
+
+    def reduce(self, y):
+        return np.asarray(y)[..., self.independent]
+
+    def expand(self, x, totals, y_ref=None):
+        """
+        Full state(s) from the independent species x (n_independent,) or (n_times, n_independent); species outside
+        the subset are taken from y_ref (default: zero).
+        """
+        x = np.asarray(x)
+        y = np.zeros(x.shape[:-1] + (self.engine.n_species,)) if y_ref is None else \
+            np.array(np.broadcast_to(y_ref, x.shape[:-1] + (self.engine.n_species,)))
+        y[..., self.independent] = x
+        y[..., self.dependent] = totals - self._m_ind.dot(x.T).T
+        return y
+
+    def reduced_jacobian(self, jac):
+        # d(f_ind)/d(y_ind) with the dependent species expressed through the conservation laws
+        rows = jac.tocsr()[self.independent]
+        return (rows[:, self.independent] - rows[:, self.dependent].dot(self._m_ind)).tocsr()
+
+    def reduced_observables(self, obs_matrix, totals):
+        # (matrix, offset) such that obs = matrix . x + offset
+        obs_matrix = csr_matrix(obs_matrix)
+        obs_dep = obs_matrix[:, self.dependent]
+        return (obs_matrix[:, self.independent] - obs_dep.dot(self._m_ind)).tocsr(), obs_dep.dot(totals)
+
+    def rhs(self, t, x, k, totals):
+        # subset-restricted systems (species is not None) need expand(..., y_ref) instead
+        return self.engine.rhs(t, self.expand(x, totals), k)[..., self.independent]
+
+    def jacobian(self, t, x, k, totals):
+        return self.reduced_jacobian(self.engine.jacobian(t, self.expand(x, totals), k))
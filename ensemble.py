@@ -0,0 +1,295 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import numpy as np
+import os
+from scipy.sparse import identity, kron
+from frozen_model import solve_observables
+from profiling import solve_ivp, stage, timed
+
+# Ensemble simulations over the Table S1 parameter uncertainties (Tasseff et al. 2010), run on a FrozenModel.
+# The network is compiled once and reused for every member; members can additionally be stacked into one
+# block-diagonal ODE system (batch_size > 1) so that a single solver call integrates a whole batch. Stacked members
+# share the solver's step size, so this only pays off for members with similar dynamics (e.g., small perturbations
+# around a fitted parameter set); for the broad Table S1 distributions batch_size=1 is faster.
+
+
+def sample_parameter_sets(param_values, param_cv, n_sets, seed=None):
+    """
+    Draw n_sets parameter vectors from log-normal distributions with mean param_values and coefficient of
+    variation param_cv (stderr/mean). Parameters with an unknown (NaN) or zero cv are kept fixed.
+    Returns an (n_sets, n_params) array.
+    """
+    rng = np.random.default_rng(seed)
+    param_values = np.asarray(param_values, dtype=float)
+    cv = np.nan_to_num(np.asarray(param_cv, dtype=float), nan=0.)
+    sigma = np.sqrt(np.log(1 + cv ** 2))
+    mu = -0.5 * sigma ** 2  # E[exp(N(mu, sigma))] = 1
+    return param_values * np.exp(rng.normal(mu, sigma, size=(n_sets, len(param_values))))
+
+
+def _solve_batch(frozen, t_span, t_eval, y0, k, method, rtol, atol, obs_names=None, prune=True):
+    # integrate a stack of n_sets independent systems as one ODE system, over the subnetwork of the species that can
+    # become nonzero in any of the sets (and are upstream of the observables in obs_names), see FrozenModel.prune
+    n_sets = len(y0)
+    net = frozen.prune(y0, obs_names) if prune else frozen.network
+    y_sub, k = y0[:, net.species], k[:, net.reactions]
+    if n_sets == 1:
+        fun, jac, y_sub, k = net.engine.rhs, net.engine.jacobian, y_sub[0], k[0]
+    else:
+        fun, jac, y_sub = net.engine.rhs_flat, net.engine.jacobian_flat, y_sub.ravel()
+    if method not in ('BDF', 'Radau'):
+        jac = None
+    if obs_names is not None:
+        # observables only, without storing the species trajectories: (n_sets, n_times, n_obs); species outside the
+        # subnetwork stay at their y0 amounts
+        obs_matrix = frozen.obs_matrix[[frozen.obs_names.index(name) for name in obs_names]]
+        obs_offset = (obs_matrix.dot(y0.T) - obs_matrix[:, net.species].dot(y0[:, net.species].T)).T.ravel()
+        obs_flat = kron(identity(n_sets, format='csr'), obs_matrix[:, net.species], format='csr')
+        output = solve_observables(fun, t_span, y_sub, t_eval, obs_flat, method=method, args=(k,), jac=jac,
+                                   rtol=rtol, atol=atol, obs_offset=obs_offset)
+        return output.reshape(len(t_eval), n_sets, -1).transpose(1, 0, 2)
+    sol = solve_ivp(fun, t_span, y_sub, method=method, t_eval=t_eval, args=(k,), rtol=rtol, atol=atol,
+                    **({} if jac is None else {'jac': jac}))
+    if not sol.success:
+        raise Exception('Integration failed: %s' % sol.message)
+    # (n_sets, n_times, n_species)
+    species = np.repeat(y0[:, None, :], len(sol.t), axis=1)
+    species[:, :, net.species] = sol.y.reshape(n_sets, net.n_species, -1).transpose(0, 2, 1)
+    return species
+
+
+@timed('simulate_ensemble')
+def simulate_ensemble(frozen, tspan, param_sets, obs_names=None, t_equil=None, perturb=None, batch_size=1,
+                      equil_cache=None, method='BDF', rtol=1e-6, atol=1e-12, tout=None, prune=True, verbose=False):
+    """
+    Simulate every parameter set in param_sets (n_sets, n_params) with the same protocol (see
+    FrozenModel.simulate for t_equil, perturb, equil_cache, tout and prune). Returns the observable trajectories as an
+    (n_sets, n_times, n_obs) array, with observables in the order of obs_names (default: all).
+    """
+    if obs_names is None:
+        obs_names = frozen.obs_names
+    param_sets = np.atleast_2d(param_sets)
+    n_sets = len(param_sets)
+    if tout is None:
+        tout = tspan
+    output = np.empty((n_sets, len(tout), len(obs_names)))
+
+    for start in range(0, n_sets, batch_size):
+        end = min(start + batch_size, n_sets)
+        param_values = frozen.get_param_values(param_sets[start:end])
+        k = frozen.rate_constants(param_values)
+        y0 = frozen.initial_state(param_values)
+        if t_equil is not None and equil_cache is not None:
+            y0 = np.array([equil_cache.get(p, t_equil, method=method, jac=True, rtol=rtol, atol=atol, prune=prune)
+                           for p in param_values])
+        elif t_equil is not None:
+            with stage('equilibrate'):
+                y0 = _solve_batch(frozen, (0, t_equil), [t_equil], y0, k, method, rtol, atol, prune=prune)[:, -1, :]
+        with stage('perturb'):
+            y0 = frozen.perturb(y0, perturb)
+        with stage('integrate'):
+            output[start:end] = _solve_batch(frozen, (tspan[0], tspan[-1]), tout, y0, k, method, rtol, atol,
+                                             obs_names=obs_names, prune=prune)
+        if verbose:
+            print('Simulated %d/%d parameter sets' % (end, n_sets))
+
+    return output
+
+
+# per-process state of the pool workers (see _init_worker)
+_worker = {}
+
+
+def _init_worker(artifact, tspan, sim_kwargs):
+    # load the compiled network once per worker process, not once per task
+    from frozen_model import FrozenModel, EquilibrationCache
+    _worker['frozen'] = FrozenModel(artifact)
+    _worker['tspan'] = tspan
+    _worker['sim_kwargs'] = dict(sim_kwargs)
+    # equil_cache=True gives each worker its own equilibration cache
+    if sim_kwargs.get('equil_cache') is True:
+        _worker['sim_kwargs']['equil_cache'] = EquilibrationCache(_worker['frozen'])
+
+
+def _run_chunk(param_sets):
+    return simulate_ensemble(_worker['frozen'], _worker['tspan'], param_sets, **_worker['sim_kwargs'])
+
+
+def _init_store_worker(artifact, tspan, sim_kwargs, store_path):
+    from trajectory_store import TrajectoryStore
+    _init_worker(artifact, tspan, sim_kwargs)
+    _worker['store'] = TrajectoryStore(store_path)
+
+
+def _run_chunk_to_store(task):
+    # the worker writes its slice into the store itself; only the member indices go back to the parent
+    members, param_sets = task
+    output = _run_chunk(param_sets)
+    for i, member in enumerate(members):
+        _worker['store'].write(member, output[i:i + 1])
+    return members
+
+
+def iter_ensemble_parallel(artifact, tspan, param_sets, n_workers=None, chunk_size=4, **kwargs):
+    """
+    Spread the parameter sets over a process pool. Each worker loads the frozen network (.npz written by
+    frozen_model.export_network) once at start-up. Yields (start index, (n_chunk, n_times, n_obs) array) in order,
+    as soon as each chunk is done. kwargs are passed to simulate_ensemble (obs_names, t_equil, perturb, ...).
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count()
+    param_sets = np.atleast_2d(param_sets)
+    starts = range(0, len(param_sets), chunk_size)
+    chunks = (param_sets[start:start + chunk_size] for start in starts)
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                             initargs=(artifact, tspan, kwargs)) as executor:
+        for start, output in zip(starts, executor.map(_run_chunk, chunks)):
+            yield start, output
+
+
+def run_ensemble_parallel(artifact, tspan, param_sets, n_workers=None, chunk_size=4, verbose=False, **kwargs):
+    """
+    Same as simulate_ensemble, but parallelized with iter_ensemble_parallel. Returns an (n_sets, n_times, n_obs)
+    array.
+    """
+    param_sets = np.atleast_2d(param_sets)
+    output = None
+    for start, chunk in iter_ensemble_parallel(artifact, tspan, param_sets, n_workers=n_workers,
+                                               chunk_size=chunk_size, **kwargs):
+        if output is None:
+            output = np.empty((len(param_sets),) + chunk.shape[1:])
+        output[start:start + len(chunk)] = chunk
+        if verbose:
+            print('Simulated %d/%d parameter sets' % (start + len(chunk), len(param_sets)))
+    return output
+
+
+def reduce_ensemble(frozen, tspan, param_sets, stats=None, chunk_size=16, verbose=False, **kwargs):
+    """
+    Streaming statistics (ensemble_stats.EnsembleStatistics by default, or any object with update(batch)) of the
+    ensemble, simulated chunk_size members at a time; the trajectories are not kept. kwargs are passed to
+    simulate_ensemble. Returns stats.
+    """
+    from ensemble_stats import EnsembleStatistics
+    if stats is None:
+        stats = EnsembleStatistics()
+    param_sets = np.atleast_2d(param_sets)
+    for start in range(0, len(param_sets), chunk_size):
+        stats.update(simulate_ensemble(frozen, tspan, param_sets[start:start + chunk_size], **kwargs))
+        if verbose:
+            print('Simulated %d/%d parameter sets' % (min(start + chunk_size, len(param_sets)), len(param_sets)))
+    return stats
+
+
+def reduce_ensemble_parallel(artifact, tspan, param_sets, stats=None, n_workers=None, chunk_size=4, verbose=False,
+                             **kwargs):
+    """
+    Same as reduce_ensemble, but parallelized with iter_ensemble_parallel; each chunk is reduced as soon as it
+    arrives.
+    """
+    from ensemble_stats import EnsembleStatistics
+    if stats is None:
+        stats = EnsembleStatistics()
+    param_sets = np.atleast_2d(param_sets)
+    for start, chunk in iter_ensemble_parallel(artifact, tspan, param_sets, n_workers=n_workers,
+                                               chunk_size=chunk_size, **kwargs):
+        stats.update(chunk)
+        if verbose:
+            print('Simulated %d/%d parameter sets' % (start + len(chunk), len(param_sets)))
+    return stats
+
+
+def run_ensemble_to_store(artifact, store_path, tspan, param_sets, param_ids=None, n_workers=None, chunk_size=4,
+                          verbose=False, **kwargs):
+    """
+    Simulate the parameter sets in parallel (see iter_ensemble_parallel) and write the observable trajectories to a
+    TrajectoryStore at store_path, which is created if it doesn't exist. param_ids identify the parameter sets
+    (default: their index in param_sets); members of an existing store with the same id that are already done are
+    skipped and new ids are appended, so an interrupted run can simply be restarted. Returns the TrajectoryStore.
+    """
+    from frozen_model import FrozenModel
+    from trajectory_store import TrajectoryStore
+    param_sets = np.atleast_2d(param_sets)
+    if param_ids is None:
+        param_ids = range(len(param_sets))
+    param_ids = [str(i) for i in param_ids]
+    if n_workers is None:
+        n_workers = os.cpu_count()
+
+    frozen = FrozenModel(artifact)
+    obs_names = kwargs.get('obs_names') or frozen.obs_names
+    times = tspan if kwargs.get('tout') is None else kwargs['tout']
+    protocol = dict(tspan=[float(tspan[0]), float(tspan[-1])], t_equil=kwargs.get('t_equil'),
+                    perturb=dict((str(sp), value) for sp, value in (kwargs.get('perturb') or {}).items()))
+    if os.path.exists(os.path.join(store_path, TrajectoryStore.HEADER)):
+        store = TrajectoryStore(store_path)
+        if store.model_hash != frozen.model_hash or store.obs_names != list(obs_names) or \
+                not np.array_equal(store.times, times) or store.protocol != _json_roundtrip(protocol):
+            raise Exception('Trajectory store %s was written for a different model or protocol' % store_path)
+    else:
+        store = TrajectoryStore.create(store_path, times, obs_names, frozen.model_hash, protocol)
+
+    # member index of every parameter set, appending the new ids
+    members = dict((param_id, i) for i, param_id in enumerate(store.param_ids))
+    new_ids = [param_id for param_id in param_ids if param_id not in members]
+    start = store.append(new_ids)
+    members.update((param_id, start + i) for i, param_id in enumerate(new_ids))
+    done = store.done()
+    todo = [(members[param_id], i) for i, param_id in enumerate(param_ids) if not done[members[param_id]]]
+
+    tasks = [([member for member, _ in todo[j:j + chunk_size]], param_sets[[i for _, i in todo[j:j + chunk_size]]])
+             for j in range(0, len(todo), chunk_size)]
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_store_worker,
+                             initargs=(artifact, tspan, kwargs, store_path)) as executor:
+        n_done = 0
+        for chunk in executor.map(_run_chunk_to_store, tasks):
+            n_done += len(chunk)
+            if verbose:
+                print('Simulated %d/%d parameter sets' % (n_done, len(todo)))
+    return store
+
+
+def _json_roundtrip(obj):
+    # how obj reads back from a JSON header (tuples become lists, ...)
+    return json.loads(json.dumps(obj, default=float))
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+    from frozen_model import FrozenModel, DEFAULT_ARTIFACT
+
+    frozen = FrozenModel()
+    tspan = np.linspace(0, 49 * 3600, 60 * 49 + 1)
+    param_sets = sample_parameter_sets(frozen.param_values, frozen.param_cv, 16, seed=0)
+
+    start = time.time()
+    obs = simulate_ensemble(frozen, tspan, param_sets, obs_names=['Her2_2_p', 'cPAcP_obs', 'PSA_obs'],
+                            t_equil=3600, perturb={'DHT(b=None)': 10})
+    elapsed = time.time() - start
+    print('%d members in %g s (%d members/hour)' % (len(param_sets), elapsed, len(param_sets) / elapsed * 3600))
+    print('Output shape:', obs.shape)
+
+    for n_workers in [1, 4]:
+        start = time.time()
+        obs_parallel = run_ensemble_parallel(DEFAULT_ARTIFACT, tspan, param_sets, n_workers=n_workers, chunk_size=1,
+                                             obs_names=['Her2_2_p', 'cPAcP_obs', 'PSA_obs'], t_equil=3600,
+                                             perturb={'DHT(b=None)': 10})
+        elapsed = time.time() - start
+        print('%d workers: %d members in %g s (%d members/hour)' %
+              (n_workers, len(param_sets), elapsed, len(param_sets) / elapsed * 3600))
+    print('Max. difference serial vs. parallel:', np.max(np.abs(obs - obs_parallel)))
+
+    stats = reduce_ensemble_parallel(DEFAULT_ARTIFACT, tspan, param_sets, n_workers=4,
+                                     obs_names=['Her2_2_p', 'cPAcP_obs', 'PSA_obs'], t_equil=3600,
+                                     perturb={'DHT(b=None)': 10})
+    print('Streaming mean/std: max. difference %g/%g' % (np.max(np.abs(stats.mean - obs.mean(axis=0))),
+                                                         np.max(np.abs(stats.std() - obs.std(axis=0, ddof=1)))))
+
+    # the store goes to a temporary directory, not into the working tree
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = run_ensemble_to_store(DEFAULT_ARTIFACT, os.path.join(tmpdir, 'ensemble_store'), tspan, param_sets,
+                                      n_workers=4, obs_names=['Her2_2_p', 'cPAcP_obs', 'PSA_obs'], t_equil=3600,
+                                      perturb={'DHT(b=None)': 10})
+        print('Store: %d members, max. difference to serial: %g' %
+              (store.n_members, np.max(np.abs(obs - store.trajectories()))))
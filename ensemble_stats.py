@@ -0,0 +1,155 @@
+import numpy as np
+
+# Streaming statistics of ensemble trajectories. Reducers are updated with batches of members, (n_members, n_times,
+# n_obs) arrays, as they finish, and keep O(n_times * n_obs) state regardless of the ensemble size.
+
+
+class RunningMeanVar(object):
+    """
+    Mean and variance by Welford's algorithm (batches are merged with the parallel formula of Chan et al.).
+    """
+    def __init__(self):
+        self.n = 0
+        self.mean = None
+        self._m2 = None
+
+    def update(self, batch):
+        batch = np.asarray(batch, dtype=float)
+        n_batch = len(batch)
+        if n_batch == 0:
+            return
+        mean_batch = batch.mean(axis=0)
+        m2_batch = ((batch - mean_batch) ** 2).sum(axis=0)
+        if self.n == 0:
+            self.n, self.mean, self._m2 = n_batch, mean_batch, m2_batch
+            return
+        n = self.n + n_batch
+        delta = mean_batch - self.mean
+        self.mean = self.mean + delta * n_batch / n
+        self._m2 = self._m2 + m2_batch + delta ** 2 * self.n * n_batch / n
+        self.n = n
+
+    def var(self, ddof=1):
+        return self._m2 / (self.n - ddof)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.var(ddof))
+
+
+class RunningMinMax(object):
+    def __init__(self):
+        self.min = None
+        self.max = None
+
+    def update(self, batch):
+        batch = np.asarray(batch, dtype=float)
+        if len(batch) == 0:
+            return
+        batch_min, batch_max = batch.min(axis=0), batch.max(axis=0)
+        self.min = batch_min if self.min is None else np.minimum(self.min, batch_min)
+        self.max = batch_max if self.max is None else np.maximum(self.max, batch_max)
+
+
+class P2Quantile(object):
+    """
+    Estimate of the p-quantile of every (time, observable) element with the P^2 algorithm (Jain & Chlamtac 1985):
+    five markers per element, adjusted with piecewise-parabolic interpolation after every observation.
+    """
+    def __init__(self, p):
+        self.p = p
+        self.n = 0
+        self._first = []  # the first five observations, until the markers are initialized
+        self._q = None  # marker heights (5, ...)
+        self._pos = None  # marker positions (5, ...)
+        self._desired = None
+        self._increment = np.array([0, p / 2, p, (1 + p) / 2, 1])
+
+    def update(self, batch):
+        for x in np.asarray(batch, dtype=float):
+            self._add(x)
+
+    def _add(self, x):
+        self.n += 1
+        if self._q is None:
+            self._first.append(x)
+            if len(self._first) == 5:
+                self._q = np.sort(np.array(self._first), axis=0)
+                shape = (5,) + (1,) * x.ndim
+                self._pos = np.broadcast_to(np.arange(5.).reshape(shape), self._q.shape).copy()
+                p = self.p
+                self._desired = np.array([0, 2 * p, 4 * p, 2 + 2 * p, 4]).reshape(shape)
+                self._first = []
+            return
+
+        q, pos = self._q, self._pos
+        # cell k of x (q[k] <= x < q[k + 1]), extending the extreme markers if needed
+        k = (x >= q[1]).astype(int) + (x >= q[2]) + (x >= q[3])
+        q[0] = np.minimum(q[0], x)
+        q[4] = np.maximum(q[4], x)
+        for i in range(1, 5):
+            pos[i] += k < i
+        self._desired = self._desired + self._increment.reshape((5,) + (1,) * x.ndim)
+
+        for i in range(1, 4):
+            d = self._desired[i] - pos[i]
+            move = ((d >= 1) & (pos[i + 1] - pos[i] > 1)) | ((d <= -1) & (pos[i - 1] - pos[i] < -1))
+            if not move.any():
+                continue
+            d = np.sign(d)
+            # piecewise-parabolic prediction, linear where it would leave the neighbouring markers
+            parabolic = q[i] + d / (pos[i + 1] - pos[i - 1]) * (
+                (pos[i] - pos[i - 1] + d) * (q[i + 1] - q[i]) / (pos[i + 1] - pos[i]) +
+                (pos[i + 1] - pos[i] - d) * (q[i] - q[i - 1]) / (pos[i] - pos[i - 1]))
+            neighbour_q = np.where(d > 0, q[i + 1], q[i - 1])
+            neighbour_pos = np.where(d > 0, pos[i + 1], pos[i - 1])
+            linear = q[i] + d * (neighbour_q - q[i]) / (neighbour_pos - pos[i])
+            new_q = np.where((q[i - 1] < parabolic) & (parabolic < q[i + 1]), parabolic, linear)
+            q[i] = np.where(move, new_q, q[i])
+            pos[i] = np.where(move, pos[i] + d, pos[i])
+
+    @property
+    def value(self):
+        if self._q is None:
+            return np.quantile(np.array(self._first), self.p, axis=0)
+        return self._q[2].copy()
+
+
+class EnsembleStatistics(object):
+    """
+    Mean, variance, min/max and quantile bands of ensemble trajectories, updated as members finish.
+    """
+    def __init__(self, quantiles=(0.05, 0.5, 0.95)):
+        self.moments = RunningMeanVar()
+        self.minmax = RunningMinMax()
+        self.quantiles = dict((p, P2Quantile(p)) for p in quantiles)
+
+    def update(self, batch):
+        self.moments.update(batch)
+        self.minmax.update(batch)
+        for reducer in self.quantiles.values():
+            reducer.update(batch)
+
+    @property
+    def n(self):
+        return self.moments.n
+
+    @property
+    def mean(self):
+        return self.moments.mean
+
+    def var(self, ddof=1):
+        return self.moments.var(ddof)
+
+    def std(self, ddof=1):
+        return self.moments.std(ddof)
+
+    @property
+    def min(self):
+        return self.minmax.min
+
+    @property
+    def max(self):
+        return self.minmax.max
+
+    def quantile(self, p):
+        return self.quantiles[p].value
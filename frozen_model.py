@@ -0,0 +1,557 @@
+from collections import OrderedDict
+from mass_action import MassActionEngine, compile_network
+import numpy as np
+import os
+from profiling import count, count_evaluations, solve_ivp, solver_class, stage, timed
+from scipy.sparse import csr_matrix, identity
+from scipy.sparse.linalg import splu
+
+# Frozen, pysb-free representation of an expanded (BNG-generated) mass-action network. Exporting requires pysb;
+# loading and simulating only need numpy and scipy, so runtime workers never import pysb or BioNetGen.
+
+# The exported network, next to this module (like network_cache.CACHE_DIR) so it is found from any working directory
+DEFAULT_ARTIFACT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AR_model_network.npz')
+
+
+@timed('compile')
+def export_network(model, filename=DEFAULT_ARTIFACT, compressed=True, param_cv=None, species_index=None):
+    """
+    Write the expanded reaction network of a pysb model to a single NumPy (.npz) archive.
+    param_cv: optional relative uncertainties of the parameters (NaN = unknown), used for ensemble sampling
+    species_index: optional species_index.SpeciesIndex, to look up species by their Tasseff names
+    """
+    from network_cache import generate_equations_cached, model_hash
+    generate_equations_cached(model)
+
+    n_species = len(model.species)
+    reactants, stoich, rate_param_idx, rate_factor = compile_network(model)
+
+    # initial conditions
+    init_species_idx = np.array([model.get_species_index(ic.pattern) for ic in model.initials], dtype=np.int32)
+    init_param_idx = np.array([model.parameters.index(ic.value) for ic in model.initials], dtype=np.int32)
+
+    # observables (n_obs x n_species coefficient matrix)
+    rows, cols, vals = [], [], []
+    for i, obs in enumerate(model.observables):
+        rows += [i] * len(obs.species)
+        cols += list(obs.species)
+        vals += list(obs.coefficients)
+    obs_matrix = csr_matrix((np.array(vals, dtype=float), (rows, cols)), shape=(len(model.observables), n_species))
+
+    if param_cv is None:
+        param_cv = np.full(len(model.parameters), np.nan)
+    tasseff_names = [''] * n_species
+    if species_index is not None:
+        tasseff_names = [name or '' for name in species_index.tasseff_names]
+
+    savez = np.savez_compressed if compressed else np.savez
+    savez(filename,
+          model_name=np.array(model.name),
+          model_hash=np.array(model_hash(model)),
+          species_names=np.array([str(sp) for sp in model.species]),
+          tasseff_names=np.array(tasseff_names),
+          param_names=np.array([p.name for p in model.parameters]),
+          param_values=np.array([p.value for p in model.parameters]),
+          param_cv=np.asarray(param_cv, dtype=float),
+          reactants=reactants,
+          rate_param_idx=rate_param_idx,
+          rate_factor=rate_factor,
+          stoich_data=stoich.data, stoich_indices=stoich.indices, stoich_indptr=stoich.indptr,
+          stoich_shape=np.array(stoich.shape),
+          init_species_idx=init_species_idx,
+          init_param_idx=init_param_idx,
+          obs_names=np.array([obs.name for obs in model.observables]),
+          obs_data=obs_matrix.data, obs_indices=obs_matrix.indices, obs_indptr=obs_matrix.indptr,
+          obs_shape=np.array(obs_matrix.shape))
+    return filename
+
+
+def solve_observables(fun, t_span, y0, t_eval, obs_matrix, method='BDF', args=(), jac=None, rtol=1e-6, atol=1e-12,
+                      obs_offset=0.):
+    """
+    Like solve_ivp, but only keeps obs_matrix . y + obs_offset at the times in t_eval (sorted): the solver is stepped
+    directly and each step's dense output is projected onto the observables, so the species trajectories are never
+    stored. Returns an (n_times, n_obs) array.
+    """
+    kwargs = {} if jac is None else {'jac': lambda t, y: jac(t, y, *args)}
+    solver = solver_class(method)(lambda t, y: fun(t, y, *args), t_span[0], np.asarray(y0, dtype=float), t_span[-1],
+                              rtol=rtol, atol=atol, **kwargs)
+    t_eval = np.asarray(t_eval, dtype=float)
+    output = np.empty((len(t_eval), obs_matrix.shape[0]))
+    i = np.searchsorted(t_eval, t_span[0], side='right')
+    output[:i] = obs_matrix.dot(solver.y)
+    while i < len(t_eval):
+        if solver.status != 'running':
+            raise Exception('Integration failed: %s' % ('output time after the end of t_span' if
+                                                        solver.status == 'finished' else 'step failed'))
+        message = solver.step()
+        if solver.status == 'failed':
+            raise Exception('Integration failed: %s' % message)
+        n = np.searchsorted(t_eval, solver.t, side='right')
+        if n > i:
+            output[i:n] = obs_matrix.dot(solver.dense_output()(t_eval[i:n])).T
+            i = n
+    count_evaluations(solver)
+    return output + obs_offset
+
+
+class EquilibrationCache(object):
+    """
+    Equilibrated (pre-stimulus) states keyed on the parameters that affect the equilibration phase, i.e., the
+    initial amounts and the rate constants of the reactions that can fire in the unstimulated system. Changing the
+    stimulus (dose, protocol) or the rate constants of reactions that only fire after the stimulus reuses the cached
+    state. At most maxsize states are kept (least recently used are dropped first).
+    """
+    def __init__(self, frozen, maxsize=1024):
+        self.frozen = frozen
+        self.maxsize = maxsize
+        self._states = OrderedDict()
+        # relevant parameters per set of initially present species (see relevant_params)
+        self._relevant = {}
+        self.hits = 0
+        self.misses = 0
+
+    def relevant_params(self, param_values):
+        # indices of the parameters that can influence the equilibration; the reachability analysis only depends on
+        # which species are initially present, so it runs once per presence pattern, not on every lookup
+        present = self.frozen.initial_state(param_values) > 0
+        key = present.tobytes()
+        if key not in self._relevant:
+            species, rxns = self.frozen.engine.reachable(present)
+            self._relevant[key] = np.union1d(self.frozen.init_param_idx, self.frozen.rate_param_idx[rxns])
+        return self._relevant[key]
+
+    def key(self, param_values, t_equil, **solver_kwargs):
+        idx = self.relevant_params(param_values)
+        return (t_equil, tuple(sorted(solver_kwargs.items())), idx.tobytes(),
+                np.ascontiguousarray(param_values[idx]).tobytes())
+
+    def get(self, param_values, t_equil, **solver_kwargs):
+        param_values = self.frozen.get_param_values(param_values)
+        key = self.key(param_values, t_equil, **solver_kwargs)
+        if key in self._states:
+            self.hits += 1
+            count('equil_cache_hits')
+            self._states.move_to_end(key)
+        else:
+            self.misses += 1
+            count('equil_cache_misses')
+            self._states[key] = self.frozen.equilibrate(param_values, t_equil, **solver_kwargs)
+            if self.maxsize is not None and len(self._states) > self.maxsize:
+                self._states.popitem(last=False)
+        return self._states[key].copy()
+
+    def clear(self):
+        self._states.clear()
+
+
+class FrozenSimulationResult(object):
+    def __init__(self, tout, species, obs_names, observables):
+        self.tout = tout
+        self.species = species  # (n_times, n_species), or None for observables_only simulations
+        self.observables = dict(zip(obs_names, observables.T))
+
+    def __getitem__(self, obs_name):
+        return self.observables[obs_name]
+
+
+class Subnetwork(object):
+    """
+    The part of a network that is integrated (see FrozenModel.prune): species and reactions are index arrays into
+    the full network, engine is the MassActionEngine over them (rate constants k[..., reactions]).
+    """
+    def __init__(self, engine, species, reactions):
+        self.engine = engine
+        self.species = species
+        self.reactions = reactions
+        self._conservation_laws = None
+
+    @property
+    def n_species(self):
+        return len(self.species)
+
+    @property
+    def n_reactions(self):
+        return len(self.reactions)
+
+    @property
+    def conservation_laws(self):
+        # conservation laws of the subnetwork (computed on first use), see conservation.py
+        if self._conservation_laws is None:
+            from conservation import ConservationLaws
+            self._conservation_laws = ConservationLaws(self.engine)
+        return self._conservation_laws
+
+
+class FrozenModel(object):
+    """
+    Mass-action network loaded from an archive written by export_network(). Does not require pysb.
+    """
+    @timed('compile')
+    def __init__(self, filename=DEFAULT_ARTIFACT):
+        with np.load(filename, allow_pickle=False) as data:
+            self.name = str(data['model_name'])
+            self.model_hash = str(data['model_hash'])
+            self.species_names = data['species_names'].tolist()
+            self.tasseff_names = data['tasseff_names'].tolist() if 'tasseff_names' in data else \
+                [''] * len(self.species_names)
+            self.param_names = data['param_names'].tolist()
+            self.param_values = data['param_values']
+            self.param_cv = data['param_cv']
+            self.reactants = data['reactants']
+            self.rate_param_idx = data['rate_param_idx']
+            self.rate_factor = data['rate_factor']
+            self.stoich = csr_matrix((data['stoich_data'], data['stoich_indices'], data['stoich_indptr']),
+                                     shape=tuple(data['stoich_shape']))
+            self.init_species_idx = data['init_species_idx']
+            self.init_param_idx = data['init_param_idx']
+            self.obs_names = data['obs_names'].tolist()
+            self.obs_matrix = csr_matrix((data['obs_data'], data['obs_indices'], data['obs_indptr']),
+                                         shape=tuple(data['obs_shape']))
+        self.engine = MassActionEngine(self.reactants, self.stoich, self.rate_param_idx, self.rate_factor)
+        # steady-state equations (see _steady_state_system), per set of reachable species
+        self._ss_systems = {}
+        self.n_species = len(self.species_names)
+        self.n_reactions = len(self.rate_factor)
+        # the full network, and the pruned subnetworks (see prune) per set of present species and observables
+        self.network = Subnetwork(self.engine, np.arange(self.n_species), np.arange(self.n_reactions))
+        self._subnetworks = {}
+        self._species_idx = dict((name, i) for i, name in enumerate(self.species_names))
+        self._tasseff_idx = dict((name, i) for i, name in enumerate(self.tasseff_names) if name)
+
+    def get_param_values(self, param_values=None):
+        # full parameter vector (model.parameters order) or a dict of {name: value} overrides of the defaults
+        if param_values is None:
+            return self.param_values.copy()
+        if isinstance(param_values, dict):
+            values = self.param_values.copy()
+            for name, value in param_values.items():
+                values[self.param_names.index(name)] = value
+            return values
+        param_values = np.asarray(param_values, dtype=float)
+        if param_values.shape[-1] != len(self.param_names):
+            raise Exception('Expected %d parameter values, got %d' % (len(self.param_names), param_values.shape[-1]))
+        return param_values
+
+    def rate_constants(self, param_values):
+        return self.engine.rate_constants(param_values)
+
+    def initial_state(self, param_values):
+        y0 = np.zeros(param_values.shape[:-1] + (self.n_species,))
+        y0[..., self.init_species_idx] = param_values[..., self.init_param_idx]
+        return y0
+
+    def rhs(self, t, y, k):
+        return self.engine.rhs(t, y, k)
+
+    def observables(self, species):
+        return self.obs_matrix.dot(np.asarray(species).T).T
+
+    def jacobian(self, t, y, k):
+        return self.engine.jacobian(t, y, k)
+
+    def _jac_kwargs(self, method, jac, jac_fn=None):
+        # analytic Jacobian: sparse for BDF/Radau, dense for LSODA (which doesn't accept sparse matrices)
+        if not jac or method not in ('BDF', 'Radau', 'LSODA'):
+            return {}
+        if jac_fn is None:
+            jac_fn = self.engine.jacobian
+        if method == 'LSODA':
+            return {'jac': lambda *args: jac_fn(*args).toarray()}
+        return {'jac': jac_fn}
+
+    @property
+    def conservation_laws(self):
+        # conservation laws of the full network (computed on first use), see conservation.py
+        return self.network.conservation_laws
+
+    def prune(self, y0, obs_names=None):
+        """
+        Subnetwork of the species that can become nonzero from y0 and the reactions that can fire (y0 may be
+        (n_sets, n_species): reachable in any of the sets). All other species keep their y0 amounts (zero) and can
+        be left out of the integration, e.g. the many zero initials of the cartesian_product loop in AR_model.py
+        that no reaction can produce. With obs_names (target-directed), only those of them upstream of these
+        observables are kept, since the others can't influence them; the subnetwork then only gives these
+        observables, not the full state.
+        """
+        present = np.any(np.atleast_2d(y0) > 0, axis=0)
+        key = (np.packbits(present).tobytes(), None if obs_names is None else tuple(obs_names))
+        if key not in self._subnetworks:
+            species, reactions = self.engine.reachable(present)
+            if obs_names is not None:
+                targets = self.obs_matrix[[self.obs_names.index(name) for name in obs_names]].indices
+                species &= self.engine.upstream(targets, reactions)
+                reactions &= self.engine.changes(species)
+            self._subnetworks[key] = Subnetwork(self.engine.subnetwork(species, reactions), np.nonzero(species)[0],
+                                                np.nonzero(reactions)[0])
+        return self._subnetworks[key]
+
+    def _integrate(self, t_span, y0, t_eval, k, method, jac, rtol, atol, reduced=False, prune=True):
+        # solve_ivp on the full system or, if reduced, on the independent species only (see conservation.py), in
+        # both cases only over the reachable subnetwork if prune; returns (times, species (n_times, n_species))
+        y0 = np.asarray(y0, dtype=float)
+        net = self.prune(y0) if prune else self.network
+        y_sub, k = y0[net.species], k[..., net.reactions]
+        if reduced:
+            laws = net.conservation_laws
+            totals = laws.totals(y_sub)
+            sol = solve_ivp(laws.rhs, t_span, laws.reduce(y_sub), method=method, t_eval=t_eval, args=(k, totals),
+                            rtol=rtol, atol=atol, **self._jac_kwargs(method, jac, laws.jacobian))
+        else:
+            sol = solve_ivp(net.engine.rhs, t_span, y_sub, method=method, t_eval=t_eval, args=(k,), rtol=rtol,
+                            atol=atol, **self._jac_kwargs(method, jac, net.engine.jacobian))
+        if not sol.success:
+            raise Exception('Integration failed: %s' % sol.message)
+        species = np.tile(y0, (len(sol.t), 1))
+        species[:, net.species] = laws.expand(sol.y.T, totals) if reduced else sol.y.T
+        return sol.t, species
+
+    def perturb(self, y, perturb):
+        # set species amounts, e.g. {'DHT(b=None)': 10}; y may be 1-D or (n_sets, n_species)
+        y = np.array(y)
+        for species, value in (perturb or {}).items():
+            idx = species if isinstance(species, (int, np.integer)) else self.species_index(species)
+            y[..., idx] = value
+        return y
+
+    def _steady_state_system(self, y0):
+        # Only species that can become nonzero from y0 (and reactions that can fire) take part; unreachable species
+        # stay at zero. Species that are never consumed (e.g., secreted sPAcP) only accumulate and have no steady
+        # state; they don't feed back on the rest of the network, so they are left out of the equations as well.
+        species, reactions = self.engine.reachable(y0 > 0)
+        key = np.packbits(species).tobytes()
+        if key not in self._ss_systems:
+            from conservation import ConservationLaws
+            active = np.intersect1d(np.nonzero(species)[0], self.engine.consumed_species())
+            self._ss_systems[key] = (active, ConservationLaws(self.engine, active, reactions))
+        return self._ss_systems[key]
+
+    def _continuation_steady_state(self, y, k, system, totals, rtol, atol, max_iter, dt=1., max_cond=1e12):
+        # Pseudo-transient continuation on f_ind(y) = 0 for the independent species, with the dependent ones given by
+        # the conservation laws (the reduced Jacobian is square and nonsingular even though the Jacobian of f itself
+        # is singular):
+        #
+        #   (I / dt - J_red) dx = f_ind
+        #
+        # i.e., implicit Euler steps that at least double (more if the residual drops faster) and turn into Newton
+        # steps near the steady state. Steps that make any species (independent or dependent) negative beyond atol
+        # or give a near-singular matrix are rejected and retried with a 10x smaller dt.
+        active, laws = system
+        ind = laws.independent
+        eye = identity(len(ind), format='csc')
+        abs_stoich = abs(self.stoich)
+
+        def residual(y):
+            # RHS of the independent species and its max and RMS norms relative to the tolerances (max <= 1:
+            # converged); the balance of each species is measured against its gross turnover, which also bounds the
+            # round-off in f
+            v = self.engine.propensities(y, k)
+            f = self.stoich.dot(v)
+            r = np.abs(f[active]) / (atol + rtol * abs_stoich.dot(v)[active])
+            if not np.all(np.isfinite(r)):
+                return f[ind], np.inf, np.inf
+            return f[ind], r.max(), np.sqrt(np.mean(r ** 2))
+
+        y = y.copy()
+        f, norm, rms = residual(y)
+        for i in range(max_iter):
+            if norm <= 1.:
+                return y
+            if not np.isfinite(norm) or dt < 1e-12:
+                return None
+            jac = laws.reduced_jacobian(self.jacobian(0, y, k))
+            y_new = None
+            if np.all(np.isfinite(jac.data)):
+                try:
+                    lu = splu((eye / dt - jac).tocsc())
+                except RuntimeError:  # exactly singular
+                    lu = None
+                pivots = None if lu is None else np.abs(lu.U.diagonal())
+                if pivots is not None and pivots.min() > pivots.max() / max_cond:
+                    y_new = laws.expand(y[ind] + lu.solve(f), totals, y_ref=y)
+            if y_new is None or np.any(y_new[active] < -atol):
+                dt /= 10.
+                continue
+            # round-off below zero
+            y_new = laws.expand(np.maximum(y_new[ind], 0.), totals, y_ref=y_new)
+            f_new, norm_new, rms_new = residual(y_new)
+            if not np.isfinite(norm_new):
+                dt /= 10.
+                continue
+            dt *= min(max(rms / rms_new, 2.), 1e3)
+            y, f, norm, rms = y_new, f_new, norm_new, rms_new
+        return None
+
+    def steady_state(self, param_values=None, y0=None, rtol=1e-8, atol=1e-10, max_iter=200,
+                     t_fallback=(1e2, 1e3, 1e4, 1e5, 1e6, 1e7), method='BDF', verbose=False):
+        """
+        Steady state of the network (for the conserved totals of y0), found by pseudo-transient continuation (growing
+        implicit Euler steps that end in Newton iteration) with the analytic Jacobian and the conservation laws as
+        constraints. If that fails, the system is integrated for increasing times (t_fallback) and the continuation
+        is restarted from the integrated state. Species that are never consumed keep their starting amounts (y0),
+        since they have no steady state.
+        """
+        param_values = self.get_param_values(param_values)
+        k = self.rate_constants(param_values)
+        y = self.initial_state(param_values) if y0 is None else np.array(y0, dtype=float)
+        system = self._steady_state_system(y)
+        active, laws = system
+        totals = laws.totals(y)
+        y_start = y.copy()
+
+        t_prev = 0.
+        for t_int in (0.,) + tuple(t_fallback):
+            if t_int > t_prev:
+                y = self._integrate((t_prev, t_int), y, [t_int], k, method, True, 1e-6, 1e-12, reduced=True)[1][-1]
+                t_prev = t_int
+            y_ss = self._continuation_steady_state(y, k, system, totals, rtol, atol, max_iter)
+            if y_ss is not None:
+                if verbose:
+                    print('Steady state found by pseudo-transient continuation after integrating for t=%g' % t_int)
+                y_ss = np.maximum(y_ss, 0.)
+                inactive = np.setdiff1d(np.arange(self.n_species), active)
+                y_ss[inactive] = y_start[inactive]
+                return y_ss
+        raise Exception('Steady state not found (continuation failed after integrating for t=%g)' % t_prev)
+
+    @timed('equilibrate')
+    def equilibrate(self, param_values, t_equil, y0=None, method='BDF', jac=True, rtol=1e-6, atol=1e-12,
+                    reduced=False, prune=True):
+        # t_equil=np.inf: go directly to the steady state instead of integrating for a fixed time
+        if np.isinf(t_equil):
+            return self.steady_state(param_values, y0=y0, method=method)
+        param_values = self.get_param_values(param_values)
+        k = self.rate_constants(param_values)
+        if y0 is None:
+            y0 = self.initial_state(param_values)
+        return self._integrate((0, t_equil), y0, [t_equil], k, method, jac, rtol, atol, reduced, prune)[1][-1]
+
+    @timed('simulate')
+    def simulate(self, tspan, param_values=None, y0=None, t_equil=None, perturb=None, equil_cache=None,
+                 method='BDF', jac=True, rtol=1e-6, atol=1e-12, tout=None, observables_only=False, obs_names=None,
+                 reduced=False, prune=True):
+        """
+        Simulate over tspan. If t_equil is given, the system is first equilibrated for t_equil (without the
+        perturbation; t_equil=np.inf for the steady state, see steady_state()); 'perturb' then sets species amounts
+        at tspan[0], e.g. perturb={'DHT(b=None)': 10}.
+        equil_cache: optional EquilibrationCache to reuse equilibrated states across doses/protocols
+        tout: report only at these times (e.g., the data times), interpolated from the adaptive steps of the solver
+        over (tspan[0], tspan[-1]); tspan can then just be the time interval
+        observables_only: compute the observables (those in obs_names, default: all) step by step, without storing
+        the species trajectories (result.species is None); see solve_observables()
+        reduced: integrate only the independent species and reconstruct the others from the conservation laws (see
+        conservation.py)
+        prune: integrate only the species that can become nonzero (and, with observables_only, that are upstream of
+        the observables in obs_names), see prune()
+        """
+        param_values = self.get_param_values(param_values)
+        k = self.rate_constants(param_values)
+        if t_equil is not None and y0 is None and equil_cache is not None:
+            y0 = equil_cache.get(param_values, t_equil, method=method, jac=jac, rtol=rtol, atol=atol, reduced=reduced,
+                                 prune=prune)
+        elif t_equil is not None:
+            y0 = self.equilibrate(param_values, t_equil, y0=y0, method=method, jac=jac, rtol=rtol, atol=atol,
+                                  reduced=reduced, prune=prune)
+        elif y0 is None:
+            y0 = self.initial_state(param_values)
+        with stage('perturb'):
+            y0 = self.perturb(y0, perturb)
+        if tout is None:
+            tout = tspan
+        if observables_only:
+            if obs_names is None:
+                obs_names = self.obs_names
+            obs_matrix = self.obs_matrix[[self.obs_names.index(name) for name in obs_names]]
+            net = self.prune(y0, obs_names) if prune else self.network
+            y_sub, k = y0[net.species], k[net.reactions]
+            # species outside the subnetwork stay at their y0 amounts
+            obs_offset = obs_matrix.dot(y0) - obs_matrix[:, net.species].dot(y_sub)
+            obs_matrix = obs_matrix[:, net.species]
+            # observables are evaluated inside the integration
+            with stage('integrate'):
+                if reduced:
+                    laws = net.conservation_laws
+                    totals = laws.totals(y_sub)
+                    obs_matrix, laws_offset = laws.reduced_observables(obs_matrix, totals)
+                    observables = solve_observables(laws.rhs, (tspan[0], tspan[-1]), laws.reduce(y_sub), tout,
+                                                    obs_matrix, method=method, args=(k, totals), rtol=rtol,
+                                                    atol=atol, obs_offset=obs_offset + laws_offset,
+                                                    **self._jac_kwargs(method, jac, laws.jacobian))
+                else:
+                    observables = solve_observables(net.engine.rhs, (tspan[0], tspan[-1]), y_sub, tout, obs_matrix,
+                                                    method=method, args=(k,), rtol=rtol, atol=atol,
+                                                    obs_offset=obs_offset,
+                                                    **self._jac_kwargs(method, jac, net.engine.jacobian))
+            return FrozenSimulationResult(np.asarray(tout, dtype=float), None, obs_names, observables)
+        with stage('integrate'):
+            t, species = self._integrate((tspan[0], tspan[-1]), y0, tout, k, method, jac, rtol, atol, reduced,
+                                         prune)
+        with stage('observe'):
+            observables = self.observables(species)
+        return FrozenSimulationResult(t, species, self.obs_names, observables)
+
+    def species_index(self, species_name):
+        # species by their pysb name, e.g. 'DHT(b=None)', or by their Tasseff name, e.g. 'Her2-2-p'
+        if species_name in self._species_idx:
+            return self._species_idx[species_name]
+        return self._tasseff_idx[species_name]
+
+
+if __name__ == '__main__':
+    import time
+    from AR_model import get_model
+    from species_index import get_species_index
+    from util import get_parameter_cvs
+
+    model = get_model()
+    export_network(model, DEFAULT_ARTIFACT, param_cv=get_parameter_cvs(model),
+                   species_index=get_species_index(model))
+
+    start = time.time()
+    frozen = FrozenModel(DEFAULT_ARTIFACT)
+    print('Loaded %s (%d species, %d reactions) in %g s' %
+          (DEFAULT_ARTIFACT, frozen.n_species, frozen.n_reactions, time.time() - start))
+
+    start = time.time()
+    result = frozen.simulate(np.linspace(0, 49 * 3600, 60 * 49 + 1), t_equil=3600, perturb={'DHT(b=None)': 10})
+    print('Simulated in %g s' % (time.time() - start))
+    for obs_name in frozen.obs_names:
+        print('%s: %g' % (obs_name, result[obs_name][-1]))
+
+    y0 = frozen.perturb(frozen.equilibrate(None, 3600), {'DHT(b=None)': 10})
+    for obs_names in [None, ['PSA_obs']]:
+        net = frozen.prune(y0, obs_names)
+        print('Pruned network%s: %d of %d species, %d of %d reactions' %
+              ('' if obs_names is None else ' for %s' % obs_names, net.n_species, frozen.n_species, net.n_reactions,
+               frozen.n_reactions))
+    start = time.time()
+    unpruned = frozen.simulate(np.linspace(0, 49 * 3600, 60 * 49 + 1), t_equil=3600, perturb={'DHT(b=None)': 10},
+                               prune=False)
+    print('Simulated without pruning in %g s, max. difference %g' %
+          (time.time() - start, max(np.max(np.abs(unpruned[name] - result[name])) for name in frozen.obs_names)))
+
+    laws = frozen.prune(y0).conservation_laws
+    start = time.time()
+    reduced = frozen.simulate(np.linspace(0, 49 * 3600, 60 * 49 + 1), t_equil=3600, perturb={'DHT(b=None)': 10},
+                              reduced=True)
+    print('Simulated with %d conservation laws (%d of %d species integrated) in %g s, max. difference %g' %
+          (laws.n_conserved, laws.n_independent, frozen.n_species, time.time() - start,
+           max(np.max(np.abs(reduced[name] - result[name])) for name in frozen.obs_names)))
+
+    # only at the data times
+    start = time.time()
+    result = frozen.simulate((0, 49 * 3600), t_equil=3600, perturb={'DHT(b=None)': 10},
+                             tout=[7200, 14400, 25200, 46800, 90000, 176400], observables_only=True)
+    print('Simulated at the data times in %g s: PSA_obs = %s' % (time.time() - start, result['PSA_obs']))
+
+    import profiling
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # the JSON report goes to a temporary directory, not into the working tree
+        with profiling.profile(os.path.join(tmpdir, 'profile.json')) as prof:
+            frozen.simulate(np.linspace(0, 49 * 3600, 60 * 49 + 1), t_equil=3600, perturb={'DHT(b=None)': 10})
+    print(prof.summary())
+
+    start = time.time()
+    y_ss = frozen.steady_state(verbose=True)
+    print('Pre-stimulus steady state in %g s: %s' % (time.time() - start, frozen.observables(y_ss)))
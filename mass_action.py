@@ -0,0 +1,233 @@
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+
+# Vectorized mass-action right-hand side for an expanded (BNG-generated) reaction network. All propensities are
+# evaluated at once as k * prod(reactant concentrations), followed by a single sparse stoichiometry product:
+#
+#   dy/dt = S . v,   v_j = k_j * prod_{i in reactants(j)} y_i
+#
+# States may be 1-D (n_species,) or 2-D (n_sets, n_species), in which case one call evaluates a whole batch of
+# parameter sets (the rate constants must then be (n_sets, n_reactions)).
+
+
+def _mass_action_rate_constant(rxn, model):
+    # BNG rates are of the form [factor*]parameter*__s0*__s1*... (see pysb.bng._parse_reaction)
+    from pysb import Parameter
+    params = [s for s in rxn['rate'].free_symbols if isinstance(s, Parameter)]
+    others = [s for s in rxn['rate'].free_symbols if not isinstance(s, Parameter) and not s.name.startswith('__s')]
+    if len(params) != 1 or len(others) > 0:
+        raise Exception('Only mass-action reactions with a single rate parameter are supported: %s' % rxn['rate'])
+    factor = float(rxn['rate'].subs({s: 1 for s in rxn['rate'].free_symbols}))
+    return model.parameters.index(params[0]), factor
+
+
+def compile_network(model):
+    """
+    Compile the reactions of a pysb model (species and reactions must already be generated) into index arrays.
+    Returns (reactants, stoich, rate_param_idx, rate_factor).
+    """
+    n_species = len(model.species)
+    n_rxns = len(model.reactions)
+
+    # reactant index arrays, padded with -1
+    max_order = max(len(rxn['reactants']) for rxn in model.reactions)
+    reactants = np.full((n_rxns, max_order), -1, dtype=np.int32)
+    rate_param_idx = np.zeros(n_rxns, dtype=np.int32)
+    rate_factor = np.ones(n_rxns)
+    rows, cols, vals = [], [], []
+    for j, rxn in enumerate(model.reactions):
+        reactants[j, :len(rxn['reactants'])] = rxn['reactants']
+        rate_param_idx[j], rate_factor[j] = _mass_action_rate_constant(rxn, model)
+        for sp in rxn['reactants']:
+            rows.append(sp)
+            cols.append(j)
+            vals.append(-1.)
+        for sp in rxn['products']:
+            rows.append(sp)
+            cols.append(j)
+            vals.append(1.)
+    # duplicate entries (e.g., 2*A -> ...) are summed when converting to CSR
+    stoich = csr_matrix((vals, (rows, cols)), shape=(n_species, n_rxns))
+    stoich.eliminate_zeros()
+
+    return reactants, stoich, rate_param_idx, rate_factor
+
+
+class MassActionEngine(object):
+    """
+    reactants: (n_reactions, max_order) species indices, padded with -1
+    stoich: sparse (n_species, n_reactions) stoichiometry matrix
+    rate_param_idx, rate_factor: rate constant of reaction j is rate_factor[j] * param_values[rate_param_idx[j]]
+    """
+    def __init__(self, reactants, stoich, rate_param_idx, rate_factor):
+        self.reactants = np.asarray(reactants)
+        self.stoich = csr_matrix(stoich)
+        self.rate_param_idx = np.asarray(rate_param_idx)
+        self.rate_factor = np.asarray(rate_factor, dtype=float)
+        self.n_species, self.n_reactions = self.stoich.shape
+        # for each reactant position, the reactions that have a reactant there and the reactant species
+        self._rxn_cols = []
+        for col in range(self.reactants.shape[1]):
+            rxns = np.nonzero(self.reactants[:, col] >= 0)[0]
+            self._rxn_cols.append((rxns, self.reactants[rxns, col]))
+        self._setup_jacobian()
+
+    def _setup_jacobian(self):
+        # dv_j/dy_l = k_j * prod_{q != p} y[reactants[j, q]], summed over the positions p where reactants[j, p] == l.
+        # Each (reaction, position) pair is one "entry"; J = S . dv/dy, so every Jacobian nonzero is a fixed linear
+        # combination of entries (with stoichiometric coefficients) that we precompute as a sparse matrix.
+        n_rxns, max_order = self.reactants.shape
+        entry_rxn, entry_pos = np.nonzero(self.reactants >= 0)
+        entry_col = self.reactants[entry_rxn, entry_pos]
+        # the other reactants of each entry, padded with n_species (a constant 1 in the extended state vector)
+        others = np.full((len(entry_rxn), max(max_order - 1, 1)), self.n_species, dtype=np.int64)
+        for e, (j, p) in enumerate(zip(entry_rxn, entry_pos)):
+            rcts = [r for q, r in enumerate(self.reactants[j]) if q != p and r >= 0]
+            others[e, :len(rcts)] = rcts
+        self._jac_entry_rxn = entry_rxn
+        self._jac_entry_others = others
+
+        # (row, col, entry, coefficient) triplets of J
+        stoich_csc = self.stoich.tocsc()
+        rows, cols, entries, coeffs = [], [], [], []
+        for e, (j, col) in enumerate(zip(entry_rxn, entry_col)):
+            start, end = stoich_csc.indptr[j], stoich_csc.indptr[j + 1]
+            rows.append(stoich_csc.indices[start:end])
+            coeffs.append(stoich_csc.data[start:end])
+            cols.append(np.full(end - start, col))
+            entries.append(np.full(end - start, e))
+        rows, cols = np.concatenate(rows).astype(np.int64), np.concatenate(cols).astype(np.int64)
+        entries, coeffs = np.concatenate(entries), np.concatenate(coeffs)
+
+        # CSR structure of J (row-major order of the unique (row, col) keys)
+        keys = rows * self.n_species + cols
+        unique_keys = np.unique(keys)
+        self._jac_indices = (unique_keys % self.n_species).astype(np.int32)
+        self._jac_indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(unique_keys // self.n_species, minlength=self.n_species))]).astype(np.int32)
+        self._jac_map = csr_matrix((coeffs, (np.searchsorted(unique_keys, keys), entries)),
+                                   shape=(len(unique_keys), len(entry_rxn)))
+        self.jac_sparsity = csr_matrix((np.ones(len(unique_keys)), self._jac_indices, self._jac_indptr),
+                                       shape=(self.n_species, self.n_species))
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(*compile_network(model))
+
+    def rate_constants(self, param_values):
+        # param_values: (n_params,) or (n_sets, n_params)
+        return self.rate_factor * np.asarray(param_values)[..., self.rate_param_idx]
+
+    def propensities(self, y, k):
+        v = np.array(np.broadcast_to(k, y.shape[:-1] + (self.n_reactions,)))
+        for rxns, species in self._rxn_cols:
+            v[..., rxns] *= y[..., species]
+        return v
+
+    def rhs(self, t, y, k):
+        v = self.propensities(y, k)
+        return self.stoich.dot(v.T).T
+
+    def jacobian(self, t, y, k):
+        """
+        Analytic Jacobian d(dy/dt)/dy as a sparse CSR matrix (1-D state only).
+        """
+        y_ext = np.append(y, 1.)
+        entry_values = k[self._jac_entry_rxn] * y_ext[self._jac_entry_others].prod(axis=1)
+        return csr_matrix((self._jac_map.dot(entry_values), self._jac_indices, self._jac_indptr),
+                          shape=(self.n_species, self.n_species))
+
+    def stoich_basis(self, species=None, reactions=None, tol=1e-10):
+        """
+        Orthonormal bases of the column space of S (Q, n_species x rank) and of its left null space
+        (L, n_conserved x n_species), from an SVD of the stoichiometry matrix (restricted to the rows in 'species'
+        and the columns in 'reactions', if given). Rows of L are (linear combinations of) conservation laws:
+        L . dy/dt = 0.
+        """
+        stoich = self.stoich.toarray()
+        if species is not None:
+            stoich = stoich[species]
+        if reactions is not None:
+            stoich = stoich[:, reactions]
+        u, s, vt = np.linalg.svd(stoich)
+        rank = int(np.sum(s > tol * s.max()))
+        return u[:, :rank], u[:, rank:].T
+
+    def consumed_species(self):
+        # species that are a reactant of at least one reaction; all others are pure accumulators (sinks)
+        return np.unique(self.reactants[self.reactants >= 0])
+
+    def reachable(self, present):
+        """
+        Species that can become nonzero, and reactions that can fire, starting from the species in 'present'
+        (boolean mask, e.g. y0 > 0). Returns (species_mask, reaction_mask).
+        """
+        species = np.array(present, dtype=bool)
+        # species x reaction incidence of the products, built once outside the fixed-point iteration
+        produces = (self.stoich > 0).astype(float)
+        while True:
+            species_ext = np.append(species, True)  # -1 padding -> always "present"
+            rxns = species_ext[self.reactants].all(axis=1)
+            new_species = species | (produces.dot(rxns.astype(float)) > 0)
+            if np.array_equal(new_species, species):
+                return species, rxns
+            species = new_species
+
+    def upstream(self, targets, reactions=None):
+        """
+        Species that can influence the species in 'targets' (mask or indices): the targets themselves and,
+        recursively, the reactants of the reactions that change them (only reactions in 'reactions', mask or
+        indices, if given). Returns a species mask.
+        """
+        allowed = np.zeros(self.n_reactions, dtype=bool)
+        allowed[np.arange(self.n_reactions) if reactions is None else reactions] = True
+        species = np.zeros(self.n_species, dtype=bool)
+        species[targets] = True
+        while True:
+            rcts = self.reactants[allowed & self.changes(species)]
+            new_species = species.copy()
+            new_species[rcts[rcts >= 0]] = True
+            if np.array_equal(new_species, species):
+                return species
+            species = new_species
+
+    def changes(self, species):
+        # reactions that change the amount of at least one of the species in 'species' (mask)
+        return abs(self.stoich).T.dot(np.asarray(species, dtype=float)) > 0
+
+    def subnetwork(self, species, reactions, fixed=None):
+        """
+        MassActionEngine of the given species and reactions (masks or indices, in the order of this network). The
+        reactants of the reactions must all be among the species; changes of species outside the subset are
+        dropped, as well as changes of the species in 'fixed' (mask or indices), which only act as reactants.
+        """
+        species = np.arange(self.n_species)[species]
+        reactions = np.arange(self.n_reactions)[reactions]
+        index = np.full(self.n_species + 1, -1, dtype=np.int32)  # index[-1]: -1 padding stays -1
+        index[species] = np.arange(len(species))
+        reactants = index[self.reactants[reactions]]
+        if np.any((reactants < 0) & (self.reactants[reactions] >= 0)):
+            raise Exception('Reactants of the selected reactions must be among the selected species')
+        stoich = self.stoich[species][:, reactions]
+        if fixed is not None:
+            changing = np.ones(self.n_species)
+            changing[fixed] = 0.
+            stoich = diags(changing[species]).dot(stoich)
+            stoich.eliminate_zeros()
+        return MassActionEngine(reactants, stoich, self.rate_param_idx[reactions], self.rate_factor[reactions])
+
+    def rhs_flat(self, t, y, k):
+        # batch RHS for ODE solvers that integrate a flattened (n_sets * n_species,) state vector
+        return self.rhs(t, y.reshape(-1, self.n_species), k).ravel()
+
+    def jacobian_flat(self, t, y, k):
+        # block-diagonal Jacobian of rhs_flat, k is (n_sets, n_reactions)
+        n_sets = len(k)
+        y_ext = np.concatenate([y.reshape(n_sets, self.n_species), np.ones((n_sets, 1))], axis=1)
+        entry_values = k[:, self._jac_entry_rxn] * y_ext[:, self._jac_entry_others].prod(axis=2)
+        data = self._jac_map.dot(entry_values.T).T.ravel()
+        nnz = len(self._jac_indices)
+        offsets = np.arange(n_sets)[:, None]
+        indices = (self._jac_indices[None, :] + offsets * self.n_species).ravel()
+        indptr = np.concatenate([(self._jac_indptr[None, :-1] + offsets * nnz).ravel(), [n_sets * nnz]])
+        return csr_matrix((data, indices, indptr), shape=(n_sets * self.n_species, n_sets * self.n_species))
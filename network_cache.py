@@ -0,0 +1,92 @@
+from pysb.bng import generate_network, _parse_netfile
+import hashlib
+import os
+from profiling import count, stage, timed
+
+# Generated BNG networks are stored here as <hash>.net files
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.network_cache')
+
+
+def _model_signature(model, **kwargs):
+    # Everything that affects the structure of the generated network. Parameters and initial values enter by NAME
+    # only, so changing a value (e.g., with divide_out_bng_multipliers) does not invalidate the cached network.
+    lines = []
+    for cpt in model.compartments:
+        lines.append('compartment %s %s %d %s' % (cpt.name, cpt.parent.name if cpt.parent else None, cpt.dimension,
+                                                  cpt.size.name if cpt.size else None))
+    for mon in model.monomers:
+        lines.append('monomer %s %s %s' % (mon.name, list(mon.sites),
+                                           [(site, list(states)) for site, states in mon.site_states.items()]))
+    for p in model.parameters:
+        lines.append('parameter %s' % p.name)
+    for expr in model.expressions:
+        lines.append('expression %s %s' % (expr.name, expr.expr))
+    for ic in model.initials:
+        lines.append('initial %r %s %s' % (ic.pattern, ic.value.name, ic.fixed))
+    for rule in model.rules:
+        lines.append('rule %s %r %s %s %s %s' % (rule.name, rule.rule_expression, rule.rate_forward.name,
+                                                 rule.rate_reverse.name if rule.rate_reverse else None,
+                                                 rule.delete_molecules, rule.move_connected))
+    for obs in model.observables:
+        lines.append('observable %s %r %s' % (obs.name, obs.reaction_pattern, obs.match))
+    # options passed to BNG's generate_network (e.g., max_iter, max_stoich)
+    for key, value in sorted(kwargs.items()):
+        lines.append('option %s %r' % (key, value))
+    return '\n'.join(lines)
+
+
+def model_hash(model, **kwargs):
+    """
+    Content hash of the monomers, rules, initials, parameters (names only) and observables of a model.
+    """
+    return hashlib.sha256(_model_signature(model, **kwargs).encode('utf-8')).hexdigest()
+
+
+@timed('network')
+def generate_equations_cached(model, cache_dir=None, verbose=False, **kwargs):
+    """
+    Drop-in replacement for pysb.bng.generate_equations that stores the BNG network on disk and reloads it
+    (species, reactions, observable groups) as long as the structure of the model hasn't changed.
+    Returns the model hash used as the cache key.
+    """
+    key = model_hash(model, **kwargs)
+    if model.reactions:
+        return key
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+    netfile = os.path.join(cache_dir, '%s.net' % key)
+
+    if os.path.exists(netfile):
+        if verbose:
+            print('Loading cached reaction network: %s' % netfile)
+        count('network_cache_hits')
+        with open(netfile, 'r') as f:
+            output = f.read()
+    else:
+        if verbose:
+            print('Generating reaction network (cache miss): %s' % netfile)
+        count('network_cache_misses')
+        # rule expansion by BNG
+        with stage('bng'):
+            output = generate_network(model, verbose=verbose, **kwargs)
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so a crash never leaves a truncated network behind
+        tmpfile = '%s.%d.tmp' % (netfile, os.getpid())
+        with open(tmpfile, 'w') as f:
+            f.write(output)
+        os.replace(tmpfile, netfile)
+
+    with stage('parse'):
+        _parse_netfile(model, iter(output.split('\n')))
+    return key
+
+
+def clear_network_cache(cache_dir=None):
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return
+    # networks and the species indices built from them (see species_index.get_species_index)
+    for filename in os.listdir(cache_dir):
+        if filename.endswith('.net') or filename.endswith('.species.json'):
+            os.remove(os.path.join(cache_dir, filename))
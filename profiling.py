@@ -0,0 +1,169 @@
+from contextlib import contextmanager, nullcontext
+import functools
+import json
+import time
+
+# Stage-level profiling of the model-to-result pipeline (build -> network -> compile -> equilibrate -> perturb ->
+# integrate -> observe). Stages are timed with named (nested) timers and the ODE solvers report counters: RHS calls,
+# Jacobian evaluations, LU decompositions, solver steps and retried steps (see solver_class). Profiling is off by
+# default; then stage() returns a shared no-op context manager and solve_ivp() is scipy's, so the overhead is a
+# global lookup.
+# scipy is only imported on first use, so that modules like AR_model can use the timers without importing it.
+#
+#   with profiling.profile('profile.json') as prof:
+#       frozen.simulate(tspan, t_equil=3600, perturb={'DHT(b=None)': 10})
+#   print(prof.summary())
+
+_profiler = None
+_NULL = nullcontext()
+
+
+class Profiler(object):
+    def __init__(self):
+        self.timers = {}  # stage path -> [total time, number of calls]
+        self.counters = {}  # stage path/counter name -> value
+        self._stack = []
+
+    def _path(self, name):
+        return '/'.join(self._stack + [name])
+
+    @contextmanager
+    def stage(self, name):
+        path = self._path(name)
+        self._stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            timer = self.timers.setdefault(path, [0., 0])
+            timer[0] += elapsed
+            timer[1] += 1
+
+    def count(self, name, n=1):
+        path = self._path(name)
+        self.counters[path] = self.counters.get(path, 0) + n
+
+    def report(self):
+        return {'timers': dict((path, {'time': t, 'calls': n}) for path, (t, n) in self.timers.items()),
+                'counters': dict(self.counters)}
+
+    def dump(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=1)
+
+    def summary(self):
+        lines = ['%-50s %10.4f s %6d calls' % (path, t, n) for path, (t, n) in sorted(self.timers.items())]
+        lines += ['%-50s %10d' % (path, n) for path, n in sorted(self.counters.items())]
+        return '\n'.join(lines)
+
+
+def enabled():
+    return _profiler is not None
+
+
+@contextmanager
+def profile(filename=None):
+    """
+    Profile the enclosed code; yields the Profiler and writes its report (JSON) to filename, if given.
+    """
+    global _profiler
+    previous, _profiler = _profiler, Profiler()
+    prof = _profiler
+    try:
+        yield prof
+    finally:
+        _profiler = previous
+        if filename is not None:
+            prof.dump(filename)
+
+
+def stage(name):
+    return _profiler.stage(name) if _profiler is not None else _NULL
+
+
+def count(name, n=1):
+    if _profiler is not None:
+        _profiler.count(name, n)
+
+
+def timed(name):
+    # decorator: run the function as stage 'name'
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_counting_solvers = {}
+
+
+def solver_class(method):
+    """
+    scipy OdeSolver class for 'method' (name or class). When profiling is enabled, a subclass that counts accepted
+    steps ('solver_steps') and, for the solvers with an explicit step size (BDF, Radau, RK45, RK23, DOP853; not
+    LSODA), the accepted steps that had to be retried at least once ('steps_with_retries': a rejection by the error
+    test or, for BDF/Radau, a failed Newton iteration, detected as a step shorter than the proposed one). This is a
+    lower bound on the number of rejections, since a step can be retried several times.
+    """
+    from scipy.integrate import BDF, DOP853, LSODA, RK23, RK45, Radau
+    solvers = {'BDF': BDF, 'Radau': Radau, 'LSODA': LSODA, 'RK45': RK45, 'RK23': RK23, 'DOP853': DOP853}
+    base = solvers[method] if isinstance(method, str) else method
+    if _profiler is None:
+        return base
+    if base not in _counting_solvers:
+        class CountingSolver(base):
+            def _step_impl(self):
+                # OdeSolver.step() only sets t_old after _step_impl() returns
+                t_start = self.t
+                proposed = getattr(self, 'h_abs', None)
+                if proposed is not None:
+                    proposed = min(proposed, self.max_step)
+                success, message = super(CountingSolver, self)._step_impl()
+                count('solver_steps')
+                if success and proposed is not None and self.t != self.t_bound and \
+                        abs(self.t - t_start) < proposed * (1 - 1e-12):
+                    count('steps_with_retries')
+                return success, message
+        CountingSolver.__name__ = 'Counting' + base.__name__
+        _counting_solvers[base] = CountingSolver
+    return _counting_solvers[base]
+
+
+def count_evaluations(result):
+    # RHS/Jacobian/LU counters of a solve_ivp result or an OdeSolver
+    count('rhs_calls', result.nfev)
+    count('jacobian_calls', result.njev)
+    count('lu_decompositions', result.nlu)
+
+
+def solve_ivp(fun, t_span, y0, method='RK45', **kwargs):
+    """
+    scipy.integrate.solve_ivp, with solver counters when profiling is enabled.
+    """
+    from scipy import integrate
+    if _profiler is None:
+        return integrate.solve_ivp(fun, t_span, y0, method=method, **kwargs)
+    sol = integrate.solve_ivp(fun, t_span, y0, method=solver_class(method), **kwargs)
+    count_evaluations(sol)
+    return sol
+
+
+if __name__ == '__main__':
+    # smoke run of the counting solvers around FrozenModel.simulate (the explicit RK solvers over a short span only,
+    # since the network is stiff); the module is imported by name so that frozen_model sees the same profiler
+    import numpy as np
+    import profiling
+    from frozen_model import FrozenModel
+
+    frozen = FrozenModel()
+    for method, t_end in [('BDF', 49 * 3600), ('Radau', 49 * 3600), ('LSODA', 49 * 3600), ('RK45', 1),
+                          ('RK23', 1), ('DOP853', 1)]:
+        with profiling.profile() as prof:
+            frozen.simulate(np.linspace(0, t_end, 50), perturb={'DHT(b=None)': 10}, method=method)
+        counters = sorted(prof.report()['counters'].items())
+        print('%s: %s' % (method, ', '.join('%s %d' % (name.split('/')[-1], n) for name, n in counters)))
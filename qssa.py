@@ -0,0 +1,274 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from frozen_model import FrozenSimulationResult
+import profiling
+from profiling import solve_ivp, stage
+import time
+
+# Quasi-steady-state reduction of fast intermediate complexes (e.g., enzyme-substrate complexes of binding ->
+# catalysis -> release triplets). Candidates are species that are only consumed by first-order reactions
+# (dissociation, catalysis, conversion), so that for the set F of fast candidates and the other (slow) species S
+#
+#   dy_F/dt = A . y_F + b(y_S),   dy_S/dt = g(y_S) + C . y_F
+#
+# with constant matrices A = J_FF and C = J_SF (first-order reactions out of and between the fast species).
+# Candidates whose lifetime 1 / (total first-order consumption rate) is below max_timescale are set to their quasi-
+# steady state y_F = -A^-1 . b(y_S). The fast species still hold material (e.g., the enzyme in a complex), so the
+# slow variables that are conserved are the lumped amounts x = y_S - C . A^-1 . y_F (e.g., free + bound enzyme),
+# not the free amounts y_S: dx/dt = f_S(y_S, y_F) has no fast terms, and L . y = L_S . x for every conservation
+# law L. The free amounts are integrated as
+#
+#   dy_S/dt = K^-1 . f_S,   K = dx/dy_S = I + G . J_FS(y_S),   G = C . A^-2
+#
+# where K only differs from the identity in the rows of the species that exchange material with fast species (a
+# small dense block), and the solver gets K^-1 . (J_SS - C . A^-1 . J_FS) as Jacobian. Each solve starts with a
+# short full-model integration (the initial layer, in which the fast species relax), and the reduced state is then
+# the one with the same lumped amounts. The reduction is built on the pruned subnetwork (see FrozenModel.prune);
+# compare() reports the error on the observables and the cost. With BDF, the reduced model takes about as many
+# steps as the full one (the fast species don't limit an implicit solver) and each RHS evaluation costs more (the
+# K solve), so it is smaller but not faster.
+
+
+class QSSReduction(object):
+    """
+    QSS reduction of a MassActionEngine (rate constants k) with the species in 'fast' (mask) at quasi-steady state.
+    The reduced state is y[..., slow].
+    """
+    def __init__(self, engine, k, fast, tol=1e-14):
+        self.engine = engine
+        self.k = k
+        self.fast = np.nonzero(fast)[0]
+        self.slow = np.nonzero(~np.asarray(fast))[0]
+        # J_FF and J_SF don't depend on the state (fast species only take part in first-order reactions)
+        jac = engine.jacobian(0, np.ones(engine.n_species), k).tocsr()
+        a = jac[self.fast][:, self.fast].toarray()
+        c = jac[self.slow][:, self.fast].toarray()
+        self._a_inv = np.linalg.inv(a) if len(self.fast) > 0 else a
+        ca = c.dot(self._a_inv)  # C . A^-1
+        g = ca.dot(self._a_inv)  # C . A^-2
+        ca[np.abs(ca) < tol * np.abs(ca).max(initial=0.)] = 0.
+        g[np.abs(g) < tol * np.abs(g).max(initial=0.)] = 0.
+        self._c = csr_matrix(c)
+        self._ca = csr_matrix(ca)
+        # positions (in the reduced state) of the species that exchange material with the fast species
+        self._rows = np.nonzero(np.any(g != 0, axis=1))[0]
+        self._g_rows = csr_matrix(g[self._rows])
+        self._eye_rows = np.eye(len(self._rows))
+        # G_R . J_FS is linear in the Jacobian data (its sparsity pattern is fixed): precompute the map from the data
+        # to the flattened (n_rows, n_slow) block
+        pattern = engine.jac_sparsity.tocoo()
+        fs = np.nonzero(np.isin(pattern.row, self.fast) & np.isin(pattern.col, self.slow))[0]
+        f_pos = np.searchsorted(self.fast, pattern.row[fs])
+        s_pos = np.searchsorted(self.slow, pattern.col[fs])
+        g_rf = g[self._rows][:, f_pos]  # (n_rows, len(fs))
+        r, p = np.nonzero(g_rf)
+        self._exchange_map = csr_matrix((g_rf[r, p], (r * len(self.slow) + s_pos[p], fs[p])),
+                                        shape=(len(self._rows) * len(self.slow), pattern.nnz))
+
+    @property
+    def n_slow(self):
+        return len(self.slow)
+
+    def expand(self, y_slow):
+        """
+        Full state(s) (n_species,) or (n_times, n_species) with the fast species at their quasi-steady state, and
+        the RHS at y_F = 0 (from which b(y_S) = f_F and g(y_S) = f_S).
+        """
+        y_slow = np.asarray(y_slow)
+        y = np.zeros(y_slow.shape[:-1] + (self.engine.n_species,))
+        y[..., self.slow] = y_slow
+        f0 = self.engine.rhs(0, y, self.k)
+        if len(self.fast) > 0:
+            y[..., self.fast] = -f0[..., self.fast].dot(self._a_inv.T)
+        return y, f0
+
+    def _exchange(self, jac):
+        # rows self._rows of K - I = G . J_FS, dense (n_rows, n_slow)
+        return self._exchange_map.dot(jac.data).reshape(len(self._rows), len(self.slow))
+
+    def rhs(self, t, y_slow):
+        y, f0 = self.expand(y_slow)
+        f = f0[self.slow] + self._c.dot(y[self.fast])
+        if len(self._rows) == 0:
+            return f
+        # K . dy_S/dt = f: rows outside self._rows are the identity
+        e = self._exchange(self.engine.jacobian(t, y, self.k))
+        e_rr = e[:, self._rows]
+        e[:, self._rows] = 0.
+        f[self._rows] = np.linalg.solve(self._eye_rows + e_rr, f[self._rows] - e.dot(f))
+        return f
+
+    def jacobian(self, t, y_slow):
+        # K^-1 . J_red (the derivative of K is left out, the solver only needs the Jacobian for its Newton iteration)
+        y = self.expand(y_slow)[0]
+        jac = self.engine.jacobian(t, y, self.k).tocsr()
+        j_red = jac[self.slow][:, self.slow] - self._ca.dot(jac[self.fast][:, self.slow])
+        if len(self._rows) == 0:
+            return j_red.tocsr()
+        e = self._exchange(jac)
+        e_rr = e[:, self._rows]
+        e[:, self._rows] = 0.
+        j = j_red.toarray()
+        j[self._rows] = np.linalg.solve(self._eye_rows + e_rr, j[self._rows] - e.dot(j))
+        return csr_matrix(j)
+
+    def reduce(self, y, rtol=1e-12, max_iter=50):
+        """
+        Free amounts y_S on the quasi-steady state with the same lumped amounts x = y_S - C . A^-1 . y_F as the full
+        state y (so the conserved totals of y are kept), by Newton iteration on y_S + G . b(y_S) = x. y should be
+        close to the quasi-steady state (e.g., at the end of the initial layer): far from it, the lumped amounts can
+        put free amounts of products below zero.
+        """
+        x = y[self.slow] - self._ca.dot(y[self.fast])
+        if len(self._rows) == 0:
+            return x
+        rows = self._rows
+        y_slow = x.copy()
+        y_slow[rows] = y[self.slow][rows]
+        for i in range(max_iter):
+            y_full, f0 = self.expand(y_slow)
+            r = y_slow[rows] + self._g_rows.dot(f0[self.fast]) - x[rows]
+            if np.abs(r).max() <= rtol * np.abs(x).max():
+                return y_slow
+            e = self._exchange(self.engine.jacobian(0, y_full, self.k))
+            y_slow[rows] -= np.linalg.solve(self._eye_rows + e[:, rows], r)
+        raise Exception('Quasi-steady state not found for the initial state')
+
+
+class QSSAModel(object):
+    """
+    QSS-reduced version of a FrozenModel for one parameter set (the time scales depend on the rate constants).
+    exclude: species (names or indices) that must stay in the integrated system, e.g. perturbed species
+    t_layer: time integrated with the full model at the start of each solve, until the fast species have reached
+    their quasi-steady state (default: 10 * max_timescale)
+    """
+    def __init__(self, frozen, param_values=None, max_timescale=0.1, exclude=(), t_layer=None):
+        self.frozen = frozen
+        self.t_layer = 10. * max_timescale if t_layer is None else t_layer
+        self.param_values = frozen.get_param_values(param_values)
+        self.k = frozen.rate_constants(self.param_values)
+        engine = frozen.engine
+        excluded = set(s if isinstance(s, (int, np.integer)) else frozen.species_index(s) for s in exclude)
+
+        # species only consumed by first-order reactions, and their lifetimes
+        n_reactants = (engine.reactants >= 0).sum(axis=1)
+        stoich = engine.stoich.tocsc()
+        rate = np.zeros(frozen.n_species)
+        candidate = np.ones(frozen.n_species, dtype=bool)
+        for j in range(frozen.n_reactions):
+            rcts = engine.reactants[j][engine.reactants[j] >= 0]
+            if n_reactants[j] == 1:
+                sp = rcts[0]
+                start, end = stoich.indptr[j], stoich.indptr[j + 1]
+                coeff = stoich.data[start:end][stoich.indices[start:end] == sp]
+                rate[sp] += self.k[j] * (-coeff[0] if len(coeff) else 0.)
+            else:
+                candidate[rcts] = False
+        with np.errstate(divide='ignore'):
+            self.timescales = np.where(rate > 0, 1. / rate, np.inf)
+        fast = candidate & (self.timescales < max_timescale)
+        fast[list(excluded)] = False
+        self.fast = np.nonzero(fast)[0]
+        # reductions per subnetwork (see _reduction)
+        self._reductions = {}
+
+    @property
+    def n_fast(self):
+        return len(self.fast)
+
+    def _reduction(self, net):
+        if net not in self._reductions:
+            self._reductions[net] = QSSReduction(net.engine, self.k[net.reactions], np.isin(net.species, self.fast))
+        return self._reductions[net]
+
+    def _integrate(self, t_span, y0, t_eval, method, rtol, atol, prune):
+        # full solve over the initial layer, then reduced solve over the (pruned) subnetwork; returns (times,
+        # species (n_times, n_species))
+        frozen = self.frozen
+        net = frozen.prune(y0) if prune else frozen.network
+        red = self._reduction(net)
+        t_eval = np.asarray(t_eval)
+        t_layer = min(t_span[0] + self.t_layer, t_span[1])
+        k = self.k[net.reactions]
+        layer = solve_ivp(net.engine.rhs, (t_span[0], t_layer), y0[net.species], method=method, args=(k,),
+                          t_eval=np.append(t_eval[t_eval < t_layer], t_layer), rtol=rtol, atol=atol,
+                          **({'jac': net.engine.jacobian} if method in ('BDF', 'Radau', 'LSODA') else {}))
+        if not layer.success:
+            raise Exception('Integration failed: %s' % layer.message)
+        t, y = [layer.t[:-1]], [layer.y[:, :-1].T]
+        if t_layer < t_span[1]:
+            sol = solve_ivp(red.rhs, (t_layer, t_span[1]), red.reduce(layer.y[:, -1]), method=method,
+                            t_eval=t_eval[t_eval >= t_layer], rtol=rtol, atol=atol,
+                            **({'jac': red.jacobian} if method in ('BDF', 'Radau', 'LSODA') else {}))
+            if not sol.success:
+                raise Exception('Integration of the reduced model failed (%s): the fast species are not separated '
+                                'from the slow dynamics, try a smaller max_timescale' % sol.message)
+            t.append(sol.t)
+            y.append(red.expand(sol.y.T)[0])
+        else:
+            t.append(layer.t[-1:])
+            y.append(layer.y[:, -1:].T)
+        t, y = np.concatenate(t), np.concatenate(y)
+        species = np.tile(y0, (len(t), 1))
+        species[:, net.species] = y
+        return t, species
+
+    def simulate(self, tspan, t_equil=None, perturb=None, method='BDF', rtol=1e-6, atol=1e-12, prune=True):
+        """
+        Same protocol as FrozenModel.simulate (t_equil must be finite). Returns a FrozenSimulationResult with the
+        fast species reconstructed from their quasi-steady state.
+        """
+        frozen = self.frozen
+        y0 = frozen.initial_state(self.param_values)
+        if t_equil is not None:
+            with stage('equilibrate'):
+                y0 = self._integrate((0, t_equil), y0, [t_equil], method, rtol, atol, prune)[1][-1]
+        y0 = frozen.perturb(y0, perturb)
+        with stage('integrate'):
+            t, species = self._integrate((tspan[0], tspan[-1]), y0, tspan, method, rtol, atol, prune)
+        return FrozenSimulationResult(t, species, frozen.obs_names, frozen.observables(species))
+
+    def compare(self, tspan, **kwargs):
+        """
+        Approximation error and cost: simulate the full and the reduced model with the same protocol (kwargs:
+        t_equil, perturb, method, rtol, atol, prune). Returns {'errors': {observable: max. relative error},
+        'time': (full, reduced), 'steps': (full, reduced), 'rhs_calls': (full, reduced)}.
+        """
+        runs = []
+        for simulate in [lambda: self.frozen.simulate(tspan, self.param_values, **kwargs),
+                         lambda: self.simulate(tspan, **kwargs)]:
+            with profiling.profile() as prof:
+                start = time.perf_counter()
+                result = simulate()
+                elapsed = time.perf_counter() - start
+            counters = prof.report()['counters']
+            runs.append((result, elapsed, sum(n for path, n in counters.items() if path.endswith('solver_steps')),
+                         sum(n for path, n in counters.items() if path.endswith('rhs_calls'))))
+        (full, full_time, full_steps, full_rhs), (reduced, reduced_time, steps, rhs_calls) = runs
+        errors = {}
+        for name in self.frozen.obs_names:
+            scale = np.max(np.abs(full[name]))
+            errors[name] = np.max(np.abs(reduced[name] - full[name])) / scale if scale > 0 else 0.
+        return {'errors': errors, 'time': (full_time, reduced_time), 'steps': (full_steps, steps),
+                'rhs_calls': (full_rhs, rhs_calls)}
+
+
+if __name__ == '__main__':
+    from frozen_model import FrozenModel
+
+    frozen = FrozenModel()
+    tspan = np.linspace(0, 49 * 3600, 60 * 49 + 1)
+    protocol = dict(t_equil=3600, perturb={'DHT(b=None)': 10})
+
+    for max_timescale in [0.1, 0.3, 1.]:
+        qssa = QSSAModel(frozen, max_timescale=max_timescale, exclude=protocol['perturb'])
+        print('max. timescale %g s: %d fast species removed' % (max_timescale, qssa.n_fast))
+        try:
+            comparison = qssa.compare(tspan, **protocol)
+        except Exception as e:
+            print('  %s' % e)
+            continue
+        for label, key in [('time (s)', 'time'), ('solver steps', 'steps'), ('RHS calls', 'rhs_calls')]:
+            print('  %s: full %g, reduced %g' % ((label,) + tuple(comparison[key])))
+        for name, error in comparison['errors'].items():
+            print('  %s: max. relative error %.3g' % (name, error))
@@ -0,0 +1,155 @@
+import numpy as np
+from profiling import solve_ivp, stage
+from scipy.sparse import csr_matrix, identity, kron
+
+# Forward sensitivities dy/dp of a FrozenModel:
+#
+#   ds_p/dt = J(y) . s_p + S . dv/dp,   s_p(0) = dy0/dp
+#
+# For mass-action kinetics dv_j/dp is nonzero only for the rate parameter of reaction j (v_j / p), so the source
+# term is a fixed sparse pattern scaled by the current propensities. The equations are solved staggered: first the
+# state (with dense output), then the sensitivities, which are linear in s given y(t). Their Jacobian is then
+# exactly diag(J, J, ..., J), so the solver's Newton iteration converges at once (integrating state and
+# sensitivities together with this matrix leaves out the coupling of s to y and stalls the solver). Both solves only
+# cover the species that can become nonzero from y0 or from the initial sensitivities (see FrozenModel.prune): the
+# others are zero for all parameter values near p, and so are their sensitivities.
+
+
+class ForwardSensitivity(object):
+    """
+    Sensitivities of all species with respect to the parameters in 'params' (names or indices; default: all).
+    The cost grows with the number of parameters; a few of them take a small multiple of one simulation.
+    """
+    def __init__(self, frozen, params=None):
+        self.frozen = frozen
+        if params is None:
+            params = range(len(frozen.param_names))
+        self.param_idx = np.array([frozen.param_names.index(p) if isinstance(p, str) else p for p in params],
+                                  dtype=np.int64)
+        self.param_names = [frozen.param_names[i] for i in self.param_idx]
+        self.n_sens = len(self.param_idx)
+        self._col = dict((p, i) for i, p in enumerate(self.param_idx))
+        # source terms per subnetwork (see _source)
+        self._sources = {}
+
+        # dy0/dp: initial amounts set by a selected parameter
+        self.s0 = np.zeros((self.n_sens, frozen.n_species))
+        for sp, p in zip(frozen.init_species_idx, frozen.init_param_idx):
+            if p in self._col:
+                self.s0[self._col[p], sp] = 1.
+
+    def _source(self, net):
+        # df/dp of the subnetwork as a fixed sparse map from the propensities without their rate parameter
+        # (dv_j/dp = rate_factor_j * prod(reactants)) to the flattened (n_sens * n_species,) source term
+        if net not in self._sources:
+            rate_params = self.frozen.rate_param_idx[net.reactions]
+            rxns = np.array([j for j, p in enumerate(rate_params) if p in self._col], dtype=np.int64)
+            cols = np.array([self._col[rate_params[j]] for j in rxns], dtype=np.int64)
+            stoich = net.engine.stoich[:, rxns].tocoo()
+            self._sources[net] = csr_matrix((stoich.data, (cols[stoich.col] * net.n_species + stoich.row,
+                                                           rxns[stoich.col])),
+                                            shape=(self.n_sens * net.n_species, net.n_reactions))
+        return self._sources[net]
+
+    def rhs(self, t, s, y_sol, net, k):
+        # sensitivities of the subnetwork species, flattened (n_sens * n_species,); y_sol: dense state solution
+        y = y_sol(t)
+        dfdp = self._source(net).dot(net.engine.propensities(y, net.engine.rate_factor))
+        ds = net.engine.jacobian(t, y, k).dot(s.reshape(self.n_sens, net.n_species).T)
+        return ds.T.ravel() + dfdp
+
+    def jacobian(self, t, s, y_sol, net, k):
+        return kron(identity(self.n_sens, format='csr'), net.engine.jacobian(t, y_sol(t), k), format='csr')
+
+    def _atol(self, param_values, atol, n_species):
+        # scale the tolerance of each sensitivity with 1/|p| (dy/dp ~ y/p)
+        p = np.abs(param_values[self.param_idx])
+        scale = np.where(p > 0, 1. / np.where(p > 0, p, 1.), 1.)
+        return np.repeat(atol * scale, n_species)
+
+    def _solve(self, t_span, t_eval, y0, s0, k, param_values, method, rtol, atol, prune):
+        # state, then sensitivities over t_span; returns (times, species (n_times, n_species),
+        # sensitivities (n_times, n_sens, n_species))
+        frozen = self.frozen
+        net = frozen.prune((y0 > 0) | np.any(s0 != 0, axis=0)) if prune else frozen.network
+        k = k[net.reactions]
+        state = solve_ivp(net.engine.rhs, t_span, y0[net.species], method=method, args=(k,), rtol=rtol, atol=atol,
+                          dense_output=True, jac=net.engine.jacobian)
+        if not state.success:
+            raise Exception('Integration failed: %s' % state.message)
+        sol = solve_ivp(self.rhs, t_span, s0[:, net.species].ravel(), method=method, t_eval=t_eval,
+                        args=(state.sol, net, k), rtol=rtol, atol=self._atol(param_values, atol, net.n_species),
+                        jac=self.jacobian)
+        if not sol.success:
+            raise Exception('Sensitivity integration failed: %s' % sol.message)
+        species = np.tile(y0, (len(sol.t), 1))
+        species[:, net.species] = state.sol(sol.t).T
+        sens = np.zeros((len(sol.t), self.n_sens, frozen.n_species))
+        sens[:, :, net.species] = sol.y.T.reshape(len(sol.t), self.n_sens, net.n_species)
+        return sol.t, species, sens
+
+    def simulate(self, tspan, param_values=None, t_equil=None, perturb=None, method='BDF', rtol=1e-6, atol=1e-12,
+                 prune=True):
+        """
+        Simulate the state and its sensitivities over tspan (same protocol as FrozenModel.simulate; t_equil must be
+        finite). Perturbed species are set to fixed amounts, so their sensitivities are reset to zero.
+        prune: integrate only the species that can become nonzero (see FrozenModel.prune)
+        Returns (FrozenSimulationResult, observable sensitivities as an (n_times, n_obs, n_params) array).
+        """
+        from frozen_model import FrozenSimulationResult
+        frozen = self.frozen
+        param_values = frozen.get_param_values(param_values)
+        k = frozen.rate_constants(param_values)
+        y0, s0 = frozen.initial_state(param_values), self.s0
+
+        if t_equil is not None:
+            if np.isinf(t_equil):
+                raise Exception('Sensitivities require a finite equilibration time')
+            with stage('equilibrate'):
+                _, species, sens = self._solve((0, t_equil), [t_equil], y0, s0, k, param_values, method, rtol, atol,
+                                               prune)
+            y0, s0 = species[-1], sens[-1]
+        s0 = s0.copy()
+        for name in (perturb or {}):
+            idx = name if isinstance(name, (int, np.integer)) else frozen.species_index(name)
+            s0[:, idx] = 0.
+        y0 = frozen.perturb(y0, perturb)
+
+        with stage('integrate'):
+            t, species, sens = self._solve((tspan[0], tspan[-1]), tspan, y0, s0, k, param_values, method, rtol, atol,
+                                           prune)
+        # (n_times, n_obs, n_params)
+        obs_sens = np.einsum('os,tps->top', frozen.obs_matrix.toarray(), sens)
+        return FrozenSimulationResult(t, species, frozen.obs_names, frozen.observables(species)), obs_sens
+
+
+if __name__ == '__main__':
+    import time
+    from frozen_model import FrozenModel
+
+    frozen = FrozenModel()
+    tspan = np.linspace(0, 49 * 3600, 49 + 1)
+    protocol = dict(t_equil=3600, perturb={'DHT(b=None)': 10})
+
+    start = time.time()
+    frozen.simulate(tspan, **protocol)
+    t_sim = time.time() - start
+    print('Simulation: %g s' % t_sim)
+    for params in [['kf_Her2_dimer'], frozen.param_names[:10]]:
+        fs = ForwardSensitivity(frozen, params)
+        start = time.time()
+        result, obs_sens = fs.simulate(tspan, **protocol)
+        elapsed = time.time() - start
+        print('%d parameter(s): %g s (%.1f simulations)' % (fs.n_sens, elapsed, elapsed / t_sim))
+
+    # compare with central finite differences (at tight tolerances) for the most influential parameters of PSA_obs
+    i_obs = frozen.obs_names.index('PSA_obs')
+    for i in np.argsort(-np.abs(obs_sens[-1, i_obs] * frozen.param_values[fs.param_idx]))[:3]:
+        p_idx = fs.param_idx[i]
+        values = []
+        for factor in [1.001, 0.999]:
+            p = frozen.param_values.copy()
+            p[p_idx] *= factor
+            values.append(frozen.simulate(tspan, p, rtol=1e-9, atol=1e-15, **protocol)['PSA_obs'][-1])
+        fd = (values[0] - values[1]) / (0.002 * frozen.param_values[p_idx])
+        print('d PSA_obs / d %s: forward %g, finite differences %g' % (fs.param_names[i], obs_sens[-1, i_obs, i], fd))
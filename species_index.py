@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+
+# Bidirectional index between the species names of Tasseff et al. 2010 (e.g., 'Her2-2-p-Shc-p') and the species of
+# the generated network (canonical hash, see util.canonical_hash, and index in model.species). Building it needs
+# pysb and a pattern match per rule species; the result is stored next to the cached networks, keyed on the model
+# hash and on a hash of the flat reactions in the model source comments (where the Tasseff names come from), and
+# reloaded (without pysb) as long as neither changes.
+
+
+class SpeciesIndex(object):
+    def __init__(self, model_hash, species_names, species_hashes, tasseff_names):
+        self.model_hash = model_hash
+        self.species_names = list(species_names)  # str(species), in model.species order
+        self.species_hashes = list(species_hashes)
+        self.tasseff_names = list(tasseff_names)  # per species, None if it has no Tasseff name
+        self._by_name = dict((name, i) for i, name in enumerate(self.tasseff_names) if name is not None)
+        self._by_hash = dict((h, i) for i, h in enumerate(self.species_hashes))
+
+    def index_of(self, name):
+        # species index of a Tasseff name
+        return self._by_name[name]
+
+    def name_of(self, species_idx):
+        # Tasseff name of a species (None if it has none)
+        return self.tasseff_names[species_idx]
+
+    def index_of_hash(self, species_hash):
+        return self._by_hash[species_hash]
+
+    def unmatched(self):
+        # indices of the species without a Tasseff name
+        return [i for i, name in enumerate(self.tasseff_names) if name is None]
+
+    def save(self, filename):
+        tmpfile = '%s.%d.tmp' % (filename, os.getpid())
+        with open(tmpfile, 'w') as f:
+            json.dump({'model_hash': self.model_hash, 'species_names': self.species_names,
+                       'species_hashes': self.species_hashes, 'tasseff_names': self.tasseff_names}, f, indent=1)
+        os.replace(tmpfile, filename)
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename) as f:
+            data = json.load(f)
+        return cls(data['model_hash'], data['species_names'], data['species_hashes'], data['tasseff_names'])
+
+
+def build_species_index(model, filename=None):
+    """
+    Match the species of a model (the network must be generated) to the Tasseff names of the rule species (see
+    util.get_tasseff_species_dict; filename: model source with the flat reactions, default: AR_model.py).
+    """
+    from network_cache import model_hash
+    from util import canonical_hash, get_tasseff_species_dict
+    species_dict = get_tasseff_species_dict(model, filename)
+    names = []
+    for species in model.species:
+        names.append(species_dict[species] if species in species_dict else None)
+    return SpeciesIndex(model_hash(model), [str(sp) for sp in model.species],
+                        [canonical_hash(sp) for sp in model.species], names)
+
+
+def flat_reactions_hash(filename=None):
+    """
+    Content hash of the flat reactions in the comments of the model source (default: AR_model.py), which are not
+    part of the model hash.
+    """
+    from util import _parse_flat_reactions_from_source
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AR_model.py')
+    flat_reactions = _parse_flat_reactions_from_source(filename)
+    return hashlib.sha256(json.dumps(flat_reactions, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def get_species_index(model, filename=None, cache_dir=None, verbose=False):
+    """
+    SpeciesIndex of a model, loaded from the network cache directory if it was built before for the same model
+    structure and flat reactions (in filename, see build_species_index), otherwise built and stored there.
+    """
+    from network_cache import CACHE_DIR, generate_equations_cached
+    key = generate_equations_cached(model, cache_dir=cache_dir)
+    filename_json = os.path.join(cache_dir or CACHE_DIR, '%s.%s.species.json' % (key, flat_reactions_hash(filename)))
+    if os.path.exists(filename_json):
+        if verbose:
+            print('Loading species index: %s' % filename_json)
+        return SpeciesIndex.load(filename_json)
+    if verbose:
+        print('Building species index: %s' % filename_json)
+    index = build_species_index(model, filename)
+    os.makedirs(os.path.dirname(filename_json), exist_ok=True)
+    index.save(filename_json)
+    return index
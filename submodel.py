@@ -0,0 +1,159 @@
+import numpy as np
+import re
+from frozen_model import FrozenSimulationResult
+from profiling import solve_ivp, stage
+from scipy.interpolate import PchipInterpolator
+
+# Pathway-level submodels of a FrozenModel, built from the model blocks in AR_model.MODULES (e.g., the AR axis with
+# transcription and translation for PSA expression under DHT). The submodel consists of
+#
+#   - internal species: species containing at least one monomer of the selected modules,
+#   - the reactions that change an internal species,
+#   - boundary species: reactants of these reactions that are not internal (e.g., ERK-pp for the AR axis).
+#
+# Boundary species only act as reactants: they are either frozen at their starting amounts or follow time courses
+# given as inputs (e.g., from a full-network simulation), interpolated with a monotone cubic (PCHIP) interpolant: it
+# has a continuous derivative (a piecewise linear input has kinks at every input time, which the solver has to step
+# through) and does not overshoot, so the amounts stay non-negative. Changes of species outside the submodel are
+# dropped.
+
+
+def species_monomers(species_name):
+    # monomer names in a species name, e.g. 'AR(lig=1, ...) % DHT(b=1)' -> {'AR', 'DHT'}
+    return set(re.findall(r'(\w+)\(', species_name))
+
+
+class Submodel(object):
+    """
+    Submodel of a FrozenModel made of the given modules (names in 'modules', or a dict {name: monomer names}).
+    """
+    def __init__(self, frozen, modules):
+        if not isinstance(modules, dict):
+            from AR_model import MODULES
+            unknown = [name for name in modules if name not in MODULES]
+            if len(unknown) > 0:
+                raise Exception('Unknown module(s) %s (available: %s)' % (unknown, list(MODULES.keys())))
+            modules = dict((name, MODULES[name]) for name in modules)
+        self.frozen = frozen
+        self.modules = list(modules.keys())
+        monomers = set(m for names in modules.values() for m in names)
+        engine = frozen.engine
+
+        internal = np.array([len(species_monomers(name) & monomers) > 0 for name in frozen.species_names])
+        reactions = engine.changes(internal)
+        boundary = np.zeros(frozen.n_species, dtype=bool)
+        rcts = engine.reactants[reactions]
+        boundary[rcts[rcts >= 0]] = True
+        boundary &= ~internal
+        species = internal | boundary
+
+        self.species = np.nonzero(species)[0]
+        self.reactions = np.nonzero(reactions)[0]
+        self.boundary = np.nonzero(boundary)[0]
+        self.engine = engine.subnetwork(species, reactions, fixed=boundary)
+        # positions of the boundary species in the submodel state
+        self._boundary_pos = np.searchsorted(self.species, self.boundary)
+        # observables that only depend on species of the submodel
+        obs_species = frozen.obs_matrix.tocsr()
+        self.obs_names = [name for i, name in enumerate(frozen.obs_names)
+                          if np.all(species[obs_species[i].indices])]
+        self._obs_matrix = frozen.obs_matrix[[frozen.obs_names.index(name) for name in self.obs_names]]
+
+    @property
+    def n_species(self):
+        return len(self.species)
+
+    @property
+    def n_reactions(self):
+        return len(self.reactions)
+
+    def boundary_names(self):
+        return [self.frozen.species_names[i] for i in self.boundary]
+
+    def _inputs(self, inputs):
+        # PCHIP interpolant of the boundary species (t -> (..., n_boundary) amounts) from a FrozenSimulationResult
+        # with species trajectories or a (times, species (n_times, n_species)) tuple of the full network
+        if isinstance(inputs, FrozenSimulationResult):
+            if inputs.species is None:
+                raise Exception('Input time courses need the species trajectories (not observables_only)')
+            times, species = inputs.tout, inputs.species
+        else:
+            times, species = inputs
+        return PchipInterpolator(np.asarray(times, dtype=float), np.asarray(species)[:, self.boundary], axis=0)
+
+    def _interpolate(self, t, inputs):
+        # boundary amounts at time(s) t (constant beyond the ends)
+        return inputs(np.clip(t, inputs.x[0], inputs.x[-1]))
+
+    def rhs(self, t, y, k, inputs=None):
+        if inputs is not None:
+            y = y.copy()
+            y[self._boundary_pos] = self._interpolate(t, inputs)
+        return self.engine.rhs(t, y, k)
+
+    def jacobian(self, t, y, k, inputs=None):
+        # boundary rows are zero; with inputs, their columns are evaluated at the input amounts
+        if inputs is not None:
+            y = y.copy()
+            y[self._boundary_pos] = self._interpolate(t, inputs)
+        return self.engine.jacobian(t, y, k)
+
+    def simulate(self, tspan, param_values=None, y0=None, perturb=None, inputs=None, method='BDF', rtol=1e-6,
+                 atol=1e-12):
+        """
+        Simulate the submodel over tspan from the full-network state y0 (default: the initial state; e.g., a state
+        equilibrated with FrozenModel.equilibrate), with the perturbation applied at tspan[0] (see
+        FrozenModel.simulate).
+        inputs: time courses of the boundary species (a FrozenSimulationResult of the full network with species
+        trajectories, or (times, species)); default: boundary species frozen at their y0 amounts
+        Returns a FrozenSimulationResult with the observables of the submodel (obs_names) and the full-network
+        species array, NaN for the species outside the submodel.
+        """
+        frozen = self.frozen
+        param_values = frozen.get_param_values(param_values)
+        k = frozen.rate_constants(param_values)[self.reactions]
+        if y0 is None:
+            y0 = frozen.initial_state(param_values)
+        y0 = frozen.perturb(y0, perturb)
+        if inputs is not None:
+            inputs = self._inputs(inputs)
+        with stage('integrate'):
+            sol = solve_ivp(self.rhs, (tspan[0], tspan[-1]), y0[self.species], method=method, t_eval=tspan,
+                            args=(k, inputs), rtol=rtol, atol=atol,
+                            **({'jac': self.jacobian} if method in ('BDF', 'Radau') else {}))
+        if not sol.success:
+            raise Exception('Integration failed: %s' % sol.message)
+        species = np.full((len(sol.t), frozen.n_species), np.nan)
+        species[:, self.species] = sol.y.T
+        if inputs is not None:
+            species[:, self.boundary] = self._interpolate(sol.t, inputs)
+        observables = self._obs_matrix[:, self.species].dot(species[:, self.species].T).T
+        return FrozenSimulationResult(sol.t, species, self.obs_names, observables)
+
+
+if __name__ == '__main__':
+    import time
+    from frozen_model import FrozenModel
+
+    frozen = FrozenModel()
+    tspan = np.linspace(0, 49 * 3600, 60 * 49 + 1)
+    perturb = {'DHT(b=None)': 10}
+    y0 = frozen.equilibrate(None, 3600)
+
+    start = time.time()
+    full = frozen.simulate(tspan, y0=y0, perturb=perturb)
+    print('Full network (%d species, %d reactions) simulated in %g s' %
+          (frozen.n_species, frozen.n_reactions, time.time() - start))
+
+    submodel = Submodel(frozen, ['ar', 'transcription', 'translation'])
+    print('Submodel %s: %d species (%d boundary), %d reactions, observables %s' %
+          (submodel.modules, submodel.n_species, len(submodel.boundary), submodel.n_reactions, submodel.obs_names))
+    for label, inputs in [('frozen boundary', None), ('boundary inputs from the full network', full)]:
+        start = time.time()
+        result = submodel.simulate(tspan, y0=y0, perturb=perturb, inputs=inputs)
+        elapsed = time.time() - start
+        print('%s: simulated in %g s' % (label, elapsed))
+        for name in submodel.obs_names:
+            scale = np.max(np.abs(full[name]))
+            print('  %s: max. relative difference to the full network %.3g' %
+                  (name, np.max(np.abs(result[name] - full[name])) / scale if scale > 0 else 0.))
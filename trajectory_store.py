@@ -0,0 +1,109 @@
+import json
+import numpy as np
+import os
+
+# On-disk store for ensemble observable trajectories that don't fit in memory. A store is a directory with
+#
+#   header.json        times, observable names, model hash, protocol, parameter-set ids, number of members
+#   trajectories.f8    float64 array (member, time, observable), accessed through numpy.memmap
+#   done.u1            uint8 flag per member, set once its trajectories have been written
+#
+# Members are written in place (e.g., directly by pool workers), so the results of an interrupted run are kept and
+# the run can be resumed or extended by appending members.
+
+
+class TrajectoryStore(object):
+    HEADER = 'header.json'
+    DATA = 'trajectories.f8'
+    DONE = 'done.u1'
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, self.HEADER)) as f:
+            self.header = json.load(f)
+        self.times = np.array(self.header['times'])
+        self.obs_names = self.header['obs_names']
+        self.model_hash = self.header['model_hash']
+        self.protocol = self.header['protocol']
+        self.param_ids = self.header['param_ids']
+
+    @classmethod
+    def create(cls, path, times, obs_names, model_hash, protocol=None):
+        if os.path.exists(os.path.join(path, cls.HEADER)):
+            raise Exception('Trajectory store already exists: %s' % path)
+        os.makedirs(path, exist_ok=True)
+        header = dict(version=1, times=[float(t) for t in times], obs_names=list(obs_names),
+                      model_hash=model_hash, protocol=protocol or {}, param_ids=[])
+        for filename in (cls.DATA, cls.DONE):
+            open(os.path.join(path, filename), 'wb').close()
+        cls._write_header(path, header)
+        return cls(path)
+
+    @classmethod
+    def _write_header(cls, path, header):
+        # write-then-rename, so a crash never leaves a truncated header
+        tmp = os.path.join(path, cls.HEADER + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(header, f, indent=1, default=float)
+        os.replace(tmp, os.path.join(path, cls.HEADER))
+
+    @property
+    def n_members(self):
+        return len(self.param_ids)
+
+    @property
+    def shape(self):
+        return self.n_members, len(self.times), len(self.obs_names)
+
+    def append(self, param_ids):
+        """
+        Add members (not yet written) with the given parameter-set ids. Returns the index of the first new member.
+        """
+        start = self.n_members
+        n_members = start + len(param_ids)
+        member_size = len(self.times) * len(self.obs_names) * 8
+        # grow the files first: a header never refers to members beyond the end of the data
+        with open(os.path.join(self.path, self.DATA), 'r+b') as f:
+            f.truncate(n_members * member_size)
+        with open(os.path.join(self.path, self.DONE), 'r+b') as f:
+            f.truncate(n_members)
+        self.param_ids = self.param_ids + [str(i) for i in param_ids]
+        self.header['param_ids'] = self.param_ids
+        self._write_header(self.path, self.header)
+        return start
+
+    def trajectories(self, mode='r'):
+        """
+        (member, time, observable) memmap of all members (mode 'r' for reading without copying, 'r+' for writing).
+        Members that haven't been written yet are zero; see done().
+        """
+        if self.n_members == 0:
+            return np.empty(self.shape)
+        return np.memmap(os.path.join(self.path, self.DATA), dtype=np.float64, mode=mode, shape=self.shape)
+
+    def done(self):
+        if self.n_members == 0:
+            return np.zeros(0, dtype=bool)
+        return np.fromfile(os.path.join(self.path, self.DONE), dtype=np.uint8, count=self.n_members).astype(bool)
+
+    def missing(self):
+        # indices of the members whose trajectories haven't been written (yet)
+        return np.nonzero(~self.done())[0]
+
+    def write(self, start, trajectories):
+        """
+        Write the trajectories of members start, start + 1, ... and mark them as done. Different processes can
+        write different members concurrently.
+        """
+        trajectories = np.asarray(trajectories)
+        data = self.trajectories('r+')
+        data[start:start + len(trajectories)] = trajectories
+        data.flush()
+        del data
+        done = np.memmap(os.path.join(self.path, self.DONE), dtype=np.uint8, mode='r+', shape=(self.n_members,))
+        done[start:start + len(trajectories)] = 1
+        done.flush()
+
+    def __getitem__(self, obs_name):
+        # (member, time) view of one observable
+        return self.trajectories()[:, :, self.obs_names.index(obs_name)]
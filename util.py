@@ -1,8 +1,11 @@
 from pysb import *
-from pysb import MonomerPattern, ComplexPattern
+from pysb import MonomerPattern, ComplexPattern, as_complex_pattern
 from pysb.util import alias_model_components
+import hashlib
 import numpy as np
+import os
 import re
+import warnings
 
 model = None
 
@@ -154,25 +157,33 @@ def create_translation_rules(prot_monomer, kf_kr, k_release, k_elongate, k_termi
     Rule('%s_degrades' % prot_monomer.name, protein >> None, k_deg)
 
 
-def _extract_bng_multipliers(mult_factor_lines):
-    factor_dict = {}
-    for line in mult_factor_lines.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        fields = line.split()
-        rate_expr = fields[3]  # e.g. "0.5*kf_EGFR_EGF_dimerize"
-        m = re.match(r"^([0-9.]+)\*([A-Za-z_]\w*)$", rate_expr)
-        if not m:
-            continue
-        factor = float(m.group(1))
-        par_name = m.group(2)
-        factor_dict[par_name] = factor
-    return factor_dict
-
-
-def divide_out_bng_multipliers(model, mult_factor_lines, verbose=True):
-    factor_dict = _extract_bng_multipliers(mult_factor_lines)
+def get_bng_multipliers(model):
+    """
+    Statistical factors BNG applied to the rate constants of the generated reactions (e.g., 0.5*kf for symmetric
+    dimerizations, 2*kf for binding to either of two identical sites), from model.reactions. Returns
+    ({parameter name: factor}, {parameter name: factors}), where the second dict holds the parameters that appear
+    with different factors in different reactions, which can't be corrected by rescaling the parameter.
+    """
+    from mass_action import _mass_action_rate_constant
+    factors = {}
+    for rxn in model.reactions:
+        param_idx, factor = _mass_action_rate_constant(rxn, model)
+        factors.setdefault(model.parameters[param_idx].name, set()).add(factor)
+    factor_dict = dict((name, f.pop()) for name, f in factors.items() if len(f) == 1 and f != {1.})
+    conflicts = dict((name, sorted(f)) for name, f in factors.items() if len(f) > 1)
+    return factor_dict, conflicts
+
+
+def divide_out_bng_multipliers(model, factor_dict=None, verbose=True):
+    """
+    Divide the parameters by the BNG statistical factors of their reactions (default: get_bng_multipliers(model),
+    which requires the reaction network), so that the effective rate constants equal the parameter values.
+    Prints every adjusted parameter (if verbose) and returns the factors that were divided out.
+    """
+    if factor_dict is None:
+        factor_dict, conflicts = get_bng_multipliers(model)
+        for par_name, factors in conflicts.items():
+            warnings.warn("%s appears with different BNG factors %s and is not corrected" % (par_name, factors))
     par_names = [p.name for p in model.parameters]
     for par_name, factor in factor_dict.items():
         if par_name not in par_names:
@@ -216,7 +227,8 @@ def _parse_flat_reactions_from_source(filename):
     arrow_pattern = re.compile(r"#\s*(\d+)\s*[.\t ]+(.*?)\s*(↔|->|→)\s*(.*)")
     with open(filename, "r") as f:
         for line in f:
-            m = arrow_pattern.match(line)
+            # the model code (with these comments) is indented inside AR_model._build_model
+            m = arrow_pattern.match(line.lstrip())
             if not m:
                 continue
             idx, lhs, arrow, rhs = m.groups()
@@ -232,24 +244,232 @@ def _parse_flat_reactions_from_source(filename):
     return flat_reactions
 
 
-def _pattern_in_species_dict(pattern, species_dict):
-    for key in species_dict.keys():
-        if pattern.is_equivalent_to(key):
-            return key
-    return False
-
-
-if __name__ == "__main__":
-    from AR_model import model
-
-    flat_reactions = _parse_flat_reactions_from_source('AR_model.py')
-
-    species_dict = {}
-    conflicts = []
-
+def _parse_parameter_uncertainties_from_source(filename):
+    """
+    Collect the 'mean±stderr' values (Table S1 of Tasseff et al. 2010) from the comments in the model source and
+    tie them to the statements that define parameters right after them, e.g.
+        # 6. EGFR-EGF-2-p+Grb2	↔	EGFR-EGF-2-p-Grb2	1.068E0±3.282E0	7.018E-1±4.517E-1	-
+        Parameter('kf_EGFR_EGF_2_p_binds_Grb2', 1.068)
+        Parameter('kr_EGFR_EGF_2_p_binds_Grb2', 0.7018)
+    or
+        # AR 192.40 ± 260.66
+        'AR_state_u_0': 192.40,
+    Returns a list of sections in source order, each a dict with 'names' (parameters named on Parameter(...) lines or
+    init_params entries; None for a create_transcription_rules/create_translation_rules call, whose parameters are
+    not named in the source), 'pairs' ([(mean, stderr)] from the comments since the previous section) and 'line'.
+    """
+    number = r"(\d+(?:\.\d*)?(?:[Ee][+-]?\d+)?)"
+    pattern = re.compile(number + r"\s*±\s*" + number)
+    param_line = re.compile(r"^\s*Parameter\('(\w+)'")
+    init_entry = re.compile(r"^\s*'(\w+_0)'\s*:")
+    helper_call = re.compile(r"^\s*create_(transcription|translation)_rules\(")
+    sections = []
+    pending = []
+    current = None
+    with open(filename, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            code, _, comment = line.partition("#")
+            pairs = [(float(mean), float(stderr)) for mean, stderr in pattern.findall(comment)]
+            m = param_line.match(code) or init_entry.match(code)
+            if not code.strip():
+                # comment or blank line: ends the current section, collects the uncertainties for the next one
+                current = None
+                pending += pairs
+            elif m:
+                if current is None:
+                    current = {'names': [], 'pairs': pending, 'line': lineno}
+                    sections.append(current)
+                    pending = []
+                current['names'].append(m.group(1))
+                current['pairs'] += pairs
+            elif helper_call.match(code):
+                current = None
+                sections.append({'names': None, 'pairs': pending + pairs, 'line': lineno})
+                pending = []
+            else:
+                current = None
+                if code.strip().startswith('Rule('):
+                    # a rule uses the parameters defined before it; its comments don't carry over
+                    pending = []
+    return sections
+
+
+def get_parameter_cvs(model, filename=None):
+    """
+    Relative uncertainties (stderr/mean) of the model parameters from Table S1, in model.parameters order. The
+    uncertainties in a comment are only matched (by value) against the parameters defined by the statements that
+    follow it (see _parse_parameter_uncertainties_from_source); the parameters created by consecutive
+    create_*_rules calls are located by their position in model.parameters (creation order), between the
+    parameters named in the source before and after the calls. Values are those in the source, i.e. before
+    dividing out BNG multipliers (see model.bng_multipliers).
+    Warns about ambiguous matches (left NaN), uncertainties that match no parameter of their section, and nonzero
+    parameters without an uncertainty (NaN; kept fixed by ensemble.sample_parameter_sets).
+    """
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AR_model.py')
+    sections = _parse_parameter_uncertainties_from_source(filename)
+    multipliers = getattr(model, 'bng_multipliers', {})
+    position = dict((p.name, i) for i, p in enumerate(model.parameters))
+
+    # merge consecutive helper calls (their parameters can only be located together)
+    groups = []
+    for section in sections:
+        if section['names'] is None and groups and groups[-1]['names'] is None:
+            groups[-1]['pairs'] = groups[-1]['pairs'] + section['pairs']
+        else:
+            groups.append(dict(section))
+    # parameters of every group, as indices into model.parameters
+    named = [[position[name] for name in group['names'] if name in position] if group['names'] is not None
+             else None for group in groups]
+    for g, group in enumerate(groups):
+        if named[g] is not None:
+            group['params'] = named[g]
+            continue
+        lo = max([i for idx in named[:g] if idx is not None for i in idx], default=-1)
+        hi = min([i for idx in named[g + 1:] if idx is not None for i in idx], default=len(model.parameters))
+        group['params'] = list(range(lo + 1, hi))
+
+    cvs = np.full(len(model.parameters), np.nan)
+    for group in groups:
+        # matching uncertainties (indices into group['pairs']) of every parameter of the group
+        matches = {}
+        for i in group['params']:
+            p = model.parameters[i]
+            source_value = p.value * multipliers.get(p.name, 1)
+            matches[i] = tuple(j for j, (mean, stderr) in enumerate(group['pairs'])
+                               if mean > 0 and np.isclose(mean, source_value, rtol=1e-9, atol=0))
+        for i, pairs in matches.items():
+            if len(pairs) == 0:
+                continue
+            stderrs = sorted(set(group['pairs'][j][1] for j in pairs))
+            # a listed value can't be shared by more parameters than it is listed for
+            n_sharing = sum(1 for other in matches.values() if other == pairs)
+            if len(stderrs) > 1 or n_sharing > len(pairs):
+                warnings.warn("%s (line %d): ambiguous Table S1 uncertainties %s for %d parameter(s), left unknown" %
+                              (model.parameters[i].name, group['line'], stderrs, n_sharing))
+            else:
+                cvs[i] = stderrs[0] / group['pairs'][pairs[0]][0]
+        used = set(j for pairs in matches.values() for j in pairs)
+        unmatched = [pair for j, pair in enumerate(group['pairs']) if j not in used and pair[0] > 0]
+        if len(unmatched) > 0:
+            warnings.warn("Table S1 uncertainties %s before line %d match no parameter value there" %
+                          (['%g±%g' % pair for pair in unmatched], group['line']))
+    missing = [p.name for i, p in enumerate(model.parameters) if np.isnan(cvs[i]) and p.value != 0]
+    if len(missing) > 0:
+        warnings.warn("%d parameters have no Table S1 uncertainty: %s" % (len(missing), ', '.join(missing)))
+    return cvs
+
+
+def _site_label(value):
+    # (state, bonds) of a site condition: None, 'state', bond, [bonds], ('state', bond), ANY, WILD, ...
+    state, bond = value if isinstance(value, tuple) and len(value) == 2 else (None, value)
+    if isinstance(value, str):
+        state, bond = value, None
+    bonds = [bond] if isinstance(bond, int) else list(bond) if isinstance(bond, list) else []
+    other = None if isinstance(bond, (int, list)) else repr(bond)
+    return repr((state, other, len(bonds))), bonds
+
+
+def _digest(label):
+    return hashlib.sha1(label.encode('utf-8')).hexdigest()
+
+
+def canonical_hash(pattern):
+    """
+    Hash of a ComplexPattern (or MonomerPattern) that doesn't depend on the bond numbering or the order of the
+    monomer patterns. Monomers are labeled with their sites and states, then refined with the labels of their bond
+    partners (Weisfeiler-Lehman) until the labels stop changing; the hash is that of the sorted labels. Equivalent
+    patterns always have the same hash. The hash is stable across processes, so it can be stored.
+    """
+    pattern = as_complex_pattern(pattern)
+    mps = pattern.monomer_patterns
+    labels, bond_ends = [], {}
+    for i, mp in enumerate(mps):
+        sites = []
+        for site, value in sorted(mp.site_conditions.items()):
+            label, bonds = _site_label(value)
+            sites.append((site, label))
+            for bond in bonds:
+                bond_ends.setdefault(bond, []).append((i, site))
+        labels.append(_digest(repr((mp.monomer.name, sites, mp.compartment.name if mp.compartment else None))))
+    neighbors = [[] for _ in mps]
+    for ends in bond_ends.values():
+        if len(ends) == 2:
+            (i, site_i), (j, site_j) = ends
+            neighbors[i].append((site_i, j, site_j))
+            neighbors[j].append((site_j, i, site_i))
+    n_classes = len(set(labels))
+    for _ in range(len(mps)):
+        labels = [_digest(repr((labels[i], sorted((site, labels[j], other_site)
+                                                  for site, j, other_site in neighbors[i]))))
+                  for i in range(len(mps))]
+        if len(set(labels)) == n_classes:
+            break
+        n_classes = len(set(labels))
+    return _digest(repr((sorted(labels), pattern.compartment.name if pattern.compartment else None,
+                         pattern.match_once)))
+
+
+class PatternIndex(object):
+    """
+    Dict of ComplexPatterns keyed by their canonical_hash(). Patterns with the same hash are confirmed with
+    is_equivalent_to(), so lookups are exact and take O(1) isomorphism checks instead of one per stored pattern.
+    """
+    def __init__(self, items=()):
+        self._buckets = {}
+        for pattern, value in items:
+            self[pattern] = value
+
+    def _lookup(self, pattern):
+        # (stored pattern, value) for the stored pattern equivalent to 'pattern', or None
+        for key, value in self._buckets.get(canonical_hash(pattern), []):
+            if as_complex_pattern(pattern).is_equivalent_to(as_complex_pattern(key)):
+                return key, value
+        return None
+
+    def find(self, pattern):
+        # the stored pattern equivalent to 'pattern', or None
+        item = self._lookup(pattern)
+        return None if item is None else item[0]
+
+    def __getitem__(self, pattern):
+        item = self._lookup(pattern)
+        if item is None:
+            raise KeyError(pattern)
+        return item[1]
+
+    def __setitem__(self, pattern, value):
+        bucket = self._buckets.setdefault(canonical_hash(pattern), [])
+        for i, (key, _) in enumerate(bucket):
+            if as_complex_pattern(pattern).is_equivalent_to(as_complex_pattern(key)):
+                bucket[i] = (key, value)
+                return
+        bucket.append((pattern, value))
+
+    def __contains__(self, pattern):
+        return self.find(pattern) is not None
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def items(self):
+        return [item for bucket in self._buckets.values() for item in bucket]
+
+    def keys(self):
+        return [key for key, value in self.items()]
+
+
+def get_tasseff_species_dict(model, filename=None, verbose=False):
+    """
+    Tasseff names of the species in the rules of the model, from the flat reactions in the comments of the model
+    source (one per rule, in the same order). Returns a PatternIndex {ComplexPattern: name}.
+    """
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AR_model.py')
+    flat_reactions = _parse_flat_reactions_from_source(filename)
+
+    species_dict = PatternIndex()
     for flat_rxn, rule in zip(flat_reactions, model.rules):
-        print(flat_rxn)
-        print(rule)
         flat_species = flat_rxn["reactants"] + flat_rxn["products"]
 
         pysb_patterns = (
@@ -263,17 +483,21 @@ if __name__ == "__main__":
             raise Exception(msg)
 
         for pattern, name in zip(pysb_patterns, flat_species):
-            print('%s: %s' % (pattern, name))
-            key = _pattern_in_species_dict(pattern, species_dict)
-            print('key:', key)
-            if key is False:
+            key = species_dict.find(pattern)
+            if key is None:
                 species_dict[pattern] = name
-                print('ADDED %s' % name)
+                if verbose:
+                    print('%s: ADDED %s' % (pattern, name))
             elif species_dict[key] != name:
-                # conflicts.append((key, species_dict[key], name))
                 raise Exception('Pattern %s associated with multiple names (%s, %s)' %
                                 (pattern, species_dict[key], name))
-        print()
+    return species_dict
+
+
+if __name__ == "__main__":
+    from AR_model import model
+
+    species_dict = get_tasseff_species_dict(model, 'AR_model.py', verbose=True)
 
     # print the dictionary assignments
     for i, (pattern, name) in enumerate(species_dict.items()):
@@ -282,29 +506,24 @@ if __name__ == "__main__":
     # quit()
 
     #####
-    from pysb import as_complex_pattern
     from pysb.simulator import ScipyOdeSimulator
+    from species_index import get_species_index
     sim = ScipyOdeSimulator(model, verbose=True, cleanup=True)
-    remove_idxs = []
-    for i, species in enumerate(model.species):
-        found = False
-        for pattern in species_dict.keys():
-            if species.is_equivalent_to(pattern):
-                found = True
-                break
-        if not found:
-            print('Removing:')
-            print('   %d: %s (%s = %g)' % \
-                  (i, model.initials[i].pattern, model.initials[i].value.name, model.initials[i].value.value))
-            remove_idxs.append(i)
+    species_index = get_species_index(model, verbose=True)
+    remove_idxs = set(species_index.unmatched())
+    # remove_idxs are species indices; report every removed species, with its initial if it has one
+    initials = dict((model.get_species_index(ic.pattern), ic) for ic in model.initials)
+    for i in sorted(remove_idxs):
+        print('Removing:')
+        if i in initials:
+            print('   %d: %s (%s = %g)' % (i, model.species[i], initials[i].value.name, initials[i].value.value))
+        else:
+            print('   %d: %s' % (i, model.species[i]))
     model.species = [v for i, v in enumerate(model.species) if i not in remove_idxs]
 
     print()
-    for i, species in enumerate(model.species):
-        for key in species_dict.keys():
-            if species.is_equivalent_to(key):
-                print('%d:' % i, species_dict[key])
-                break
+    for i, name in enumerate(name for name in species_index.tasseff_names if name is not None):
+        print('%d:' % i, name)
     print()
     print('Number of species:', len(model.species))
     print()
@@ -326,20 +545,16 @@ if __name__ == "__main__":
         for cp in rule.reactant_pattern.complex_patterns:
             # print(cp, type(cp))
             # print(cp.is_concrete())
-            for key in species_dict.keys():
-                if as_complex_pattern(key).is_equivalent_to(cp):
-                    reactants.append(species_dict[key])
-                    break
+            if cp in species_dict:
+                reactants.append(species_dict[cp])
             # print(reactants)
         # print('Products:')
         products = []
         for cp in rule.product_pattern.complex_patterns:
             # print(cp, type(cp))
             # print(cp.is_concrete())
-            for key in species_dict.keys():
-                if as_complex_pattern(key).is_equivalent_to(cp):
-                    products.append(species_dict[key])
-                    break
+            if cp in species_dict:
+                products.append(species_dict[cp])
             # print(products)
         # print rule to screen
         arrow = '<->' if rule.is_reversible else '-->'